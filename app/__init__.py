@@ -5,6 +5,7 @@ from flask_migrate import Migrate
 from flask_login import LoginManager
 import uuid
 import os
+from pathlib import Path
 from sqlalchemy import text
 import logging
 from flask_cors import CORS
@@ -19,6 +20,15 @@ def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # Resolve the profile upload directory once so request handlers don't re-create it
+    profile_upload_dir = Path(app.static_folder) / 'uploads' / 'profiles'
+    try:
+        profile_upload_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # best-effort: the app may be running on a read-only filesystem
+        pass
+    app.config['PROFILE_UPLOAD_DIR'] = profile_upload_dir
+
     # Add CORS support for Chrome extension and web clients
     CORS(app, 
          origins=["chrome-extension://*", "http://localhost:*", "https://localhost:*"],
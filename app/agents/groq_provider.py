@@ -1,9 +1,11 @@
 import os
+import asyncio
 import logging
+import weakref
 from typing import Any, Dict, List
 from fastapi.concurrency import run_in_threadpool
 
-from groq import Groq
+from groq import Groq, AsyncGroq
 #from sentence_transformers import SentenceTransformer
 
 from ..agents.exceptions import ProviderError
@@ -18,6 +20,9 @@ class GroqProvider(Provider):
         if not api_key:
             raise ProviderError("Groq API key is missing")
         self._client = Groq(api_key=api_key)
+        self._api_key = api_key
+        # AsyncGroq wraps an httpx.AsyncClient, which is tied to the event loop it was first used on
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGroq]" = weakref.WeakKeyDictionary()
         self.model = model
 
     def _generate_sync(self, prompt: str, options: Dict[str, Any]) -> str:
@@ -35,6 +40,35 @@ class GroqProvider(Provider):
             logger.error(f"Groq generation error: {e}")
             raise ProviderError(f"Groq - error generating response: {e}") from e
 
+    def _get_async_client(self) -> AsyncGroq:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncGroq(api_key=self._api_key)
+            self._async_clients[loop] = client
+        return client
+
+    async def _generate_async(self, prompt: str, options: Dict[str, Any]) -> str:
+        logger.info(f"Generating response with Groq model (async): {self.model}")
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                **options,
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Groq generation error: {e}")
+            raise ProviderError(f"Groq - error generating response: {e}") from e
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running event loop, if one was created"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
     async def __call__(self, prompt: str, **generation_args: Any) -> str:
         opts = {
             "temperature": generation_args.get("temperature", 0),
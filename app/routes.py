@@ -1,26 +1,33 @@
 from flask import Blueprint, render_template, render_template_string, send_from_directory, redirect, url_for, request, flash, current_app, jsonify, Response, session
 import stripe
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
 from werkzeug.utils import secure_filename
 from app.services.EmailService import EmailService
-from app.services.StripeCheckout import StripeCheckout
+from app.services.StripeCheckout import get_checkout
 from app.forms import PurchaseForm, ContactForm, JobScrapingForm
 import jwt
 from datetime import datetime, timedelta
 import json
+import orjson
+import msgspec
 from pathlib import Path
+import re
 import secrets
+import hashlib
+from itertools import zip_longest
 from app.services.jobspy_service import fetch_jobs_from_jobspy
 from app.services.job_analyzer import OptimizedJobAnalyzer
 from app.services.resume_improver import ResumeImprover
-from app.services.latex_resume_generator import LaTeXResumeGenerator
+from app.services.latex_resume_generator import get_latex_generator
 import logging
 from pathlib import Path as _Path
 from app.services.resume_parser import parse_resume, _read_text_from_file
 from app.services.ai_resume_parser import parse_text as ai_parse_text
-from app.services.normalize_parser import normalize
+from app.services.normalize_parser import normalize, to_parsed_resume
 from app.models import db, User, Profile
-from sqlalchemy import text
+from sqlalchemy import text, insert
 import uuid
 from app.forms import LoginForm, SignupForm
 from flask_login import login_user, logout_user, login_required, current_user
@@ -32,6 +39,13 @@ main_blueprint = Blueprint('main', __name__)
 # Logger for this module
 _logger = logging.getLogger(__name__)
 
+# Upper bounds for resume text handed to the AI parser: files larger than this are not
+# sent to the LLM at all, and extracted text is truncated to keep prompts bounded.
+MAX_AI_PARSE_FILE_BYTES = 10 * 1024 * 1024
+MAX_PARSE_CHARS = 2_000_000
+# Uploads stored under their SHA-256 content digest by _save_upload_by_digest
+_DIGEST_UPLOAD_RE = re.compile(r'^[0-9a-f]{64}(\.[a-z0-9]+)?$')
+
 # Lazily initialize the heavy JobAnalyzer to avoid loading large NLP models at import time.
 # This prevents worker startup timeouts and high memory usage when handling light requests
 # (e.g., public pages, login/signup) that don't need the analyzer.
@@ -73,6 +87,56 @@ def get_job_analyzer():
 # DO NOT initialize at module load - keep truly lazy
 
 
+# EmailService holds a pooled httpx client and the background outbox; share one per worker process.
+# Creation is locked so concurrent first requests don't each build (and leak) a client.
+_EMAIL_SERVICE = None
+_EMAIL_SERVICE_LOCK = threading.Lock()
+
+def get_email_service():
+    """Return the process-wide EmailService instance, creating it on first use."""
+    global _EMAIL_SERVICE
+    if _EMAIL_SERVICE is not None:
+        return _EMAIL_SERVICE
+
+    with _EMAIL_SERVICE_LOCK:
+        if _EMAIL_SERVICE is None:
+            _EMAIL_SERVICE = EmailService()
+    return _EMAIL_SERVICE
+
+
+# The local PDF/DOCX parser is CPU-bound; run it in worker processes so parses in one gunicorn
+# worker don't serialize on the GIL. Created on first use so forking happens after startup.
+_PARSE_POOL = None
+_PARSE_POOL_LOCK = threading.Lock()
+LOCAL_PARSE_TIMEOUT = 30  # seconds
+# Each worker holds a full interpreter, so the pool is capped regardless of the core count
+LOCAL_PARSE_MAX_WORKERS = int(os.environ.get("LOCAL_PARSE_MAX_WORKERS", "2"))
+
+def get_parse_pool():
+    """Return the process pool used for local resume parsing, creating it on first use."""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        return _PARSE_POOL
+
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=max(1, min(os.cpu_count() or 1, LOCAL_PARSE_MAX_WORKERS))
+            )
+    return _PARSE_POOL
+
+
+def parse_resume_local(path):
+    """Run the local resume parser in the process pool and wait for its result."""
+    future = get_parse_pool().submit(parse_resume, str(path))
+    try:
+        return future.result(timeout=LOCAL_PARSE_TIMEOUT)
+    except FuturesTimeoutError:
+        # Drop the parse if it is still queued so it doesn't hold a worker after we give up
+        future.cancel()
+        raise
+
+
 # Helper utilities to persist large scraped job payloads to server-side cache files
 def _ensure_job_cache_dir():
     cache_dir = _Path(current_app.instance_path) / 'job_cache'
@@ -163,6 +227,55 @@ def _cleanup_old_cache_files(cache_dir):
     except Exception as e:
         current_app.logger.warning('Cache cleanup failed: %s', e)
 
+def _save_upload_by_digest(file_storage, upload_folder, chunk_size=64 * 1024):
+    """
+    Stream an uploaded file to disk while hashing it, and store it as ``{sha256}{ext}``.
+    Returns ``(saved_path, digest)``; identical uploads land on the same path.
+    """
+    ext = Path(secure_filename(file_storage.filename or '')).suffix.lower()
+    hasher = hashlib.sha256()
+    tmp_path = upload_folder / f".upload-{uuid.uuid4().hex}.part"
+    try:
+        with open(tmp_path, 'wb') as out:
+            while True:
+                chunk = file_storage.stream.read(chunk_size)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                out.write(chunk)
+        digest = hasher.hexdigest()
+        saved_path = upload_folder / f"{digest}{ext}"
+        os.replace(tmp_path, saved_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return saved_path, digest
+
+
+def _parse_cache_path(upload_folder, digest):
+    """Location of the cached normalized parse result for an upload's content digest."""
+    return upload_folder / f"{digest}.parsed.json"
+
+
+def _orjson_response(payload, status=200):
+    """JSON response serialized with orjson; bytes go straight into the body with no re-encode."""
+    return Response(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype='application/json')
+
+
+def _decode_parse_cache(cache_path):
+    """Decode a cached parse result into a ParsedResume, or None if it is unusable (the reason is logged)."""
+    try:
+        return to_parsed_resume(orjson.loads(cache_path.read_bytes()))
+    except (OSError, orjson.JSONDecodeError, msgspec.ValidationError) as e:
+        _logger.warning('Discarding unusable parse cache %s: %s', cache_path.name, e)
+        return None
+
+
+def _write_parse_cache(cache_path, parsed):
+    """Persist a normalized parse result for an uploaded resume."""
+    cache_path.write_bytes(orjson.dumps(parsed, option=orjson.OPT_NON_STR_KEYS))
+
+
 def is_admin_email(email):
     """
     Check if an email is an admin email using environment variables
@@ -257,7 +370,7 @@ def admin_license_success():
         order_id = generate_admin_order_id()
         
         # Send license key via email
-        email_service = EmailService()
+        email_service = get_email_service()
         email_result = email_service.send_admin_license_email(
             to_email=email,
             to_name=name,
@@ -271,8 +384,8 @@ def admin_license_success():
         else:
             flash(f'License generated (Order: {order_id}) but email failed: {email_result.get("error", "Unknown error")}', 'warning')
         
-        # Log for admin reference (remove in production or use proper logging)
-        print(f"Admin license generated - Email: {email}, Order: {order_id}, Key: {license_key}")
+        # Log for admin reference (never log the key itself)
+        current_app.logger.info('Admin license generated - Email: %s, Order: %s', email, order_id)
         
     except Exception as e:
         flash(f'Error generating admin license: {str(e)}', 'error')
@@ -297,7 +410,7 @@ def create_checkout_session():
     
     try:
         # Initialize the Stripe checkout service
-        stripe_checkout = StripeCheckout()
+        stripe_checkout = get_checkout()
         
         # Create checkout session
         checkout_session = stripe_checkout.create_session(
@@ -352,7 +465,7 @@ def success():
     hours = int(request.args.get('hours', 1)) # Convert to int immediately
     
     try:
-        stripe_checkout = StripeCheckout()
+        stripe_checkout = get_checkout()
         session = stripe_checkout.verify_payment(session_id)
         
         if session.payment_status == 'paid':
@@ -365,7 +478,7 @@ def success():
             license_key = generate_license(customer_email, hours=license_hours)
             
             # Send license key via email with validation
-            email_service = EmailService()
+            email_service = get_email_service()
             email_result = email_service.send_license_email(
                 to_email=customer_email,
                 to_name=customer_name,
@@ -374,6 +487,7 @@ def success():
                 valid_hours=license_hours
             )
             
+            # Sent synchronously so the success message is only shown once the key was delivered
             if email_result['success']:
                 flash('Payment successful! Your license key has been sent to your email.', 'success')
             else:
@@ -385,10 +499,7 @@ def success():
                     flash('Payment successful! There was an issue sending your license key. Please contact support.', 'warning')
                 
                 # Log the error for manual follow-up
-                #print(f"Email error for order {session_id}: {error_message}")
-                
-            # Log the license key (for debugging)
-            #print(f"Generated license key for {customer_email}: {license_key}")
+                current_app.logger.warning('License email error for order %s: %s', session_id, error_message)
             
         else:
             flash('Payment not completed. Please try again.', 'error')
@@ -419,11 +530,12 @@ def contact():
     form = ContactForm()
     if form.validate_on_submit():
         # Send email with the contact form data
-        email_service = EmailService()
+        email_service = get_email_service()
         email_result = email_service.send_contact_email(
             from_email=form.email.data,
             from_name=form.name.data,
-            message=form.message.data
+            message=form.message.data,
+            background=True
         )
         
         if email_result['success']:
@@ -443,17 +555,14 @@ def test_linkedin():
 def retrieve_jobs():
     """Retrieve jobs data from localStorage (sent from frontend)"""
     try:
-        print("=== /jobs/retrieve endpoint called ===")
         jobs_data = request.get_json()
-        print(f"Received jobs_data: {jobs_data}")
         
         if not jobs_data or 'jobs' not in jobs_data:
-            print("ERROR: No jobs data received or missing 'jobs' key")
+            current_app.logger.warning("/jobs/retrieve: no jobs data received or missing 'jobs' key")
             return jsonify({'error': 'No jobs data received'}), 400
         
         # Process and validate the jobs data
         jobs_list = jobs_data.get('jobs', [])
-        print(f"Jobs list length: {len(jobs_list)}")
         
         search_info = {
             'search_term': jobs_data.get('searchTerm', ''),
@@ -463,15 +572,14 @@ def retrieve_jobs():
             'timestamp': jobs_data.get('timestamp'),
             'scraped_from_extension': True
         }
-        print(f"Search info: {search_info}")
+        if current_app.logger.isEnabledFor(logging.DEBUG):
+            current_app.logger.debug('/jobs/retrieve: %d jobs, search info: %s', len(jobs_list), search_info)
         
         # Validate and deduplicate job data structure
         validated_jobs = []
         seen_jobs = set()  # For deduplication by title+company combination
         
-        for i, job in enumerate(jobs_list):
-            print(f"Processing job {i+1}: {job.get('title', 'No title')} at {job.get('company', 'No company')}")
-            
+        for job in jobs_list:
             # Create deduplication key
             title = job.get('title', 'N/A').strip().lower()
             company = job.get('company', 'N/A').strip().lower()
@@ -479,7 +587,7 @@ def retrieve_jobs():
             
             # Skip duplicates
             if dedupe_key in seen_jobs:
-                print(f"Skipping duplicate job: {title} at {company}")
+                current_app.logger.debug('Skipping duplicate job: %s at %s', title, company)
                 continue
             
             seen_jobs.add(dedupe_key)
@@ -504,32 +612,22 @@ def retrieve_jobs():
         if cache_fname:
             session['scraped_jobs_cache'] = cache_fname
 
-        print(f"Stored {len(validated_jobs)} jobs in server cache: {cache_fname}")
-        print("Session keys:", list(session.keys()))
-
-        current_app.logger.info(f"Retrieved {len(validated_jobs)} jobs from extension")
+        current_app.logger.info('Retrieved %d jobs from extension (server cache: %s)', len(validated_jobs), cache_fname)
 
         response_data = {
             'success': True,
             'jobs_count': len(validated_jobs),
             'redirect_url': url_for('main.jobs_list')
         }
-        print(f"Returning response: {response_data}")
-        
         return jsonify(response_data)
         
     except Exception as e:
-        print(f"ERROR in /jobs/retrieve: {str(e)}")
         current_app.logger.error(f"Error retrieving jobs: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 @main_blueprint.route('/jobs', methods=['GET', 'POST'])
 @login_required
 def jobs():
-    print("=== /jobs route called ===")
-    print(f"Request method: {request.method}")
-    print(f"Session keys: {list(session.keys())}")
-    
     form = JobScrapingForm()
     jobs_data = None
     search_info = None
@@ -636,7 +734,7 @@ def jobs():
             except Exception as _sess_err:
                 current_app.logger.warning('Failed to persist scraped jobs into server cache: %s', _sess_err)
         except Exception as e:
-            print(f"Error scraping jobs: {str(e)}")
+            current_app.logger.error('Error scraping jobs: %s', e)
             flash(f'Error scraping jobs: {str(e)}', 'error')
 
     # If user is logged in, load their profiles
@@ -1155,17 +1253,16 @@ def add_profile():
         # Handle file uploads
         resume = request.files.get('resume')
         cover_letter = request.files.get('cover_letter')
-        upload_folder = Path(current_app.static_folder) / 'uploads' / 'profiles'
-        upload_folder.mkdir(parents=True, exist_ok=True)
+        upload_folder = current_app.config['PROFILE_UPLOAD_DIR']
 
         saved_resume_filename = None
         saved_cover_letter_filename = None
         
+        resume_digest = None
         if resume:
             filename = secure_filename(resume.filename)
             if filename:
-                saved_path = upload_folder / f"resume_{filename}"
-                resume.save(saved_path)
+                saved_path, resume_digest = _save_upload_by_digest(resume, upload_folder)
                 saved_resume_filename = str(saved_path.relative_to(Path(current_app.static_folder)))
         
         if cover_letter:
@@ -1175,65 +1272,58 @@ def add_profile():
                 cover_letter.save(saved_path)
                 saved_cover_letter_filename = str(saved_path.relative_to(Path(current_app.static_folder)))
 
-        # If a resume file was uploaded, attempt to reuse a cached parse or parse once and cache result
+        # Reuse the normalized result written by the parse endpoint; the cache is keyed on the
+        # resume's content digest, so re-uploading the same file hits it regardless of its name.
+        # Only parse here (AI first, then local fallback) when no cached result exists.
+        parsed_resume_filename = secure_filename(request.form.get('parsed_resume_filename') or '')
         extracted_keywords = None
         parsed_data = None
         try:
-            if saved_filename:
-                full_saved_path = Path(current_app.static_folder) / saved_filename
-                cache_path = full_saved_path.with_name(full_saved_path.name + '.parsed.json')
+            full_saved_path = Path(current_app.static_folder) / saved_resume_filename if saved_resume_filename else None
+            cache_path = None
+            if resume_digest:
+                cache_path = _parse_cache_path(upload_folder, resume_digest)
+            elif parsed_resume_filename:
+                cache_path = _parse_cache_path(upload_folder, Path(parsed_resume_filename).stem)
+
+            if cache_path is not None and cache_path.exists():
+                # The cache is already normalized by the parse endpoint
+                parsed_data = _decode_parse_cache(cache_path)
+            elif full_saved_path is not None:
+                try:
+                    # Extract text with the same reader as the parse endpoint (handles PDF/DOCX)
+                    parsed_norm = None
+                    if full_saved_path.stat().st_size <= MAX_AI_PARSE_FILE_BYTES:
+                        text, _ = _read_text_from_file(str(full_saved_path))
+                        text = (text or '')[:MAX_PARSE_CHARS]
+                        parsed_raw = ai_parse_text(text) if text.strip() else None
+                        parsed_norm = normalize(parsed_raw) if parsed_raw else None
+                    else:
+                        current_app.logger.info('Resume %s too large for AI parsing, using local parser', full_saved_path.name)
 
-                # If a cached parse exists (created by the parse endpoint), reuse it to avoid another LLM call
-                if cache_path.exists():
-                    try:
-                        with cache_path.open('r', encoding='utf-8') as cj:
-                            parsed_cached = json.load(cj)
-                        if parsed_cached and isinstance(parsed_cached, dict):
-                            # parsed_cached is expected to already be normalized by the parse endpoint
-                            parsed_data = parsed_cached
-                            extracted_keywords = parsed_cached.get('extracted_keywords')
-                    except Exception:
-                        extracted_keywords = None
-
-                # If no cache, perform a single parse here (AI first, then local fallback) and write cache
-                if not parsed_data and not cache_path.exists():
-                    try:
-                        # Read file text for AI parsing - ignore binary errors
-                        with open(full_saved_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            text = f.read()
+                    # If AI parser didn't return structured result, fallback to local parser
+                    if not parsed_norm or parsed_norm.get('raw'):
+                        try:
+                            local_raw = parse_resume_local(full_saved_path)
+                            parsed_norm = normalize(local_raw)
+                        except Exception:
+                            parsed_norm = parsed_norm or {}
 
-                        parsed_raw = ai_parse_text(text)
-                        parsed_norm = normalize(parsed_raw) if parsed_raw else None
+                    # Save cache if we got a dict
+                    if isinstance(parsed_norm, dict):
+                        try:
+                            _write_parse_cache(cache_path, parsed_norm)
+                        except Exception:
+                            current_app.logger.debug('Failed to write parse cache', exc_info=True)
 
-                        # If AI parser didn't return structured result, fallback to local parser
-                        if not parsed_norm or parsed_norm.get('raw'):
-                            try:
-                                local_raw = parse_resume(str(full_saved_path))
-                                parsed_norm = normalize(local_raw)
-                            except Exception:
-                                parsed_norm = parsed_norm or {}
-
-                        # Save cache if we got a dict
-                        if isinstance(parsed_norm, dict):
-                            try:
-                                with cache_path.open('w', encoding='utf-8') as cj:
-                                    json.dump(parsed_norm, cj)
-                            except Exception:
-                                current_app.logger.debug('Failed to write parse cache', exc_info=True)
-
-                        if isinstance(parsed_norm, dict):
-                            parsed_data = parsed_norm
-                            extracted_keywords = parsed_norm.get('extracted_keywords')
-                    except Exception:
-                        extracted_keywords = None
-
-                # Ensure keywords are a list of strings if present
-                if extracted_keywords and not isinstance(extracted_keywords, list):
-                    if isinstance(extracted_keywords, str):
-                        extracted_keywords = [k.strip() for k in extracted_keywords.split(',') if k.strip()]
-                    else:
-                        extracted_keywords = None
+                        parsed_data = to_parsed_resume(parsed_norm)
+                except Exception:
+                    parsed_data = None
+
+            if parsed_data is not None:
+                extracted_keywords = parsed_data.extracted_keywords or None
         except Exception:
+            parsed_data = None
             extracted_keywords = None
 
         # Parse repeatable fields from the form
@@ -1255,20 +1345,22 @@ def add_profile():
         starts = request.form.getlist('work_start[]')
         ends = request.form.getlist('work_end[]')
         descriptions = request.form.getlist('work_description[]')
-        work_items = []
-        max_work = max(len(titles), len(companies), len(locations), len(experience_types), len(starts), len(ends), len(descriptions)) if any([titles, companies, locations, experience_types, starts, ends, descriptions]) else 0
-        for i in range(max_work):
-            item = {
-                'title': (titles[i] if i < len(titles) else '') or '',
-                'company': (companies[i] if i < len(companies) else '') or '',
-                'location': (locations[i] if i < len(locations) else '') or '',
-                'experienceType': (experience_types[i] if i < len(experience_types) else '') or '',
-                'start': (starts[i] if i < len(starts) else '') or '',
-                'end': (ends[i] if i < len(ends) else '') or '',
-                'description': ((descriptions[i] if i < len(descriptions) else '') or '').strip()
-            }
-            if any(item.values()):
-                work_items.append(item)
+        work_items = [
+            item for item in (
+                {
+                    'title': t or '',
+                    'company': c or '',
+                    'location': loc or '',
+                    'experienceType': xt or '',
+                    'start': st or '',
+                    'end': en or '',
+                    'description': (d or '').strip()
+                }
+                for t, c, loc, xt, st, en, d in zip_longest(
+                    titles, companies, locations, experience_types, starts, ends, descriptions, fillvalue='')
+            )
+            if any(item.values())
+        ]
 
         # Education
         schools = request.form.getlist('edu_school[]')
@@ -1278,35 +1370,38 @@ def add_profile():
         edu_starts = request.form.getlist('edu_start[]')
         edu_ends = request.form.getlist('edu_end[]')
         edu_descs = request.form.getlist('edu_description[]')
-        edu_items = []
-        max_edu = max(len(schools), len(majors), len(degree_types), len(gpas), len(edu_starts), len(edu_ends), len(edu_descs)) if any([schools, majors, degree_types, gpas, edu_starts, edu_ends, edu_descs]) else 0
-        for i in range(max_edu):
-            item = {
-                'school': (schools[i] if i < len(schools) else '') or '',
-                'major': (majors[i] if i < len(majors) else '') or '',
-                'degreetype': (degree_types[i] if i < len(degree_types) else '') or '',
-                'gpa': (gpas[i] if i < len(gpas) else '') or '',
-                'start': (edu_starts[i] if i < len(edu_starts) else '') or '',
-                'end': (edu_ends[i] if i < len(edu_ends) else '') or '',
-                'description': ((edu_descs[i] if i < len(edu_descs) else '') or '').strip()
-            }
-            if any(item.values()):
-                edu_items.append(item)
+        edu_items = [
+            item for item in (
+                {
+                    'school': sc or '',
+                    'major': mj or '',
+                    'degreetype': dt or '',
+                    'gpa': g or '',
+                    'start': st or '',
+                    'end': en or '',
+                    'description': (d or '').strip()
+                }
+                for sc, mj, dt, g, st, en, d in zip_longest(
+                    schools, majors, degree_types, gpas, edu_starts, edu_ends, edu_descs, fillvalue='')
+            )
+            if any(item.values())
+        ]
 
         # Projects
         project_titles = request.form.getlist('project_title[]')
         project_links = request.form.getlist('project_link[]')
         project_descs = request.form.getlist('project_description[]')
-        project_items = []
-        max_proj = max(len(project_titles), len(project_links), len(project_descs)) if any([project_titles, project_links, project_descs]) else 0
-        for i in range(max_proj):
-            item = {
-                'title': (project_titles[i] if i < len(project_titles) else '') or '',
-                'link': (project_links[i] if i < len(project_links) else '') or '',
-                'description': ((project_descs[i] if i < len(project_descs) else '') or '').strip()
-            }
-            if any(item.values()):
-                project_items.append(item)
+        project_items = [
+            item for item in (
+                {
+                    'title': t or '',
+                    'link': lnk or '',
+                    'description': (d or '').strip()
+                }
+                for t, lnk, d in zip_longest(project_titles, project_links, project_descs, fillvalue='')
+            )
+            if any(item.values())
+        ]
 
         certifications = request.form.getlist('certification[]') or []
         certifications = [c for c in certifications if c and c.strip()]
@@ -1319,16 +1414,16 @@ def add_profile():
 
         # Extract title from parsed data if available and not manually provided
         title = None
-        if parsed_data and isinstance(parsed_data, dict):
+        if parsed_data is not None:
             # Try to get title from parsed data (before it gets normalized to headline)
-            title = parsed_data.get('title') or parsed_data.get('headline')
+            title = parsed_data.title or parsed_data.headline
         
         # Use manual form inputs if provided, otherwise use parsed data defaults
-        final_name = f"{first_name or ''} {last_name or ''}".strip() or (parsed_data.get('name') if parsed_data else None)
-        final_email = email or (parsed_data.get('email') if parsed_data else None)
-        final_phone = phone or (parsed_data.get('phone') if parsed_data else None)
-        final_headline = headline or (parsed_data.get('headline') if parsed_data else None)
-        final_location = location or (parsed_data.get('location') if parsed_data else None)
+        final_name = f"{first_name or ''} {last_name or ''}".strip() or (parsed_data.name if parsed_data else None)
+        final_email = email or (parsed_data.email if parsed_data else None)
+        final_phone = phone or (parsed_data.phone if parsed_data else None)
+        final_headline = headline or (parsed_data.headline if parsed_data else None)
+        final_location = location or (parsed_data.location if parsed_data else None)
 
         # Persist to DB
         try:
@@ -1336,7 +1431,8 @@ def add_profile():
             if current_user and getattr(current_user, 'is_authenticated', False):
                 user_id = current_user.get_id()
 
-            profile = Profile(
+            # Single-row Core INSERT: skips the ORM unit-of-work and per-attribute change tracking
+            db.session.execute(insert(Profile.__table__).values(
                 user_id=user_id,
                 resume_filename=saved_resume_filename,
                 cover_letter_filename=saved_cover_letter_filename,
@@ -1363,16 +1459,15 @@ def add_profile():
                 visa_sponsorship=visa_sponsorship,
                 disability=disability,
                 veteran=veteran,
-                skills=skills or (parsed_data.get('skills') if parsed_data else None),
-                work_experience=work_items or (parsed_data.get('work_experience') if parsed_data else None),
-                education=edu_items or (parsed_data.get('education') if parsed_data else None),
-                projects=project_items or (parsed_data.get('projects') if parsed_data else None),
-                certifications=certifications or (parsed_data.get('certifications') if parsed_data else None),
-                languages=languages or (parsed_data.get('languages') if parsed_data else None),
-                links=links or (parsed_data.get('links') if parsed_data else None),
+                skills=skills or (parsed_data.skills if parsed_data else None),
+                work_experience=work_items or (parsed_data.work_experience if parsed_data else None),
+                education=edu_items or (parsed_data.education if parsed_data else None),
+                projects=project_items or (parsed_data.projects if parsed_data else None),
+                certifications=certifications or (parsed_data.certifications if parsed_data else None),
+                languages=languages or (parsed_data.languages if parsed_data else None),
+                links=links or (parsed_data.links if parsed_data else None),
                 extracted_keywords=extracted_keywords or None
-            )
-            db.session.add(profile)
+            ))
             db.session.commit()
             flash('Profile saved successfully.', 'success')
             return redirect(url_for('main.jobs'))
@@ -1395,15 +1490,21 @@ def parse_resume_route():
     if resume.filename == '':
         return jsonify({'error': 'Empty filename.'}), 400
 
-    upload_folder = Path(current_app.static_folder) / 'uploads' / 'profiles'
-    upload_folder.mkdir(parents=True, exist_ok=True)
-    filename = secure_filename(resume.filename)
-    saved_path = upload_folder / filename
-    resume.save(saved_path)
-
-    
+    upload_folder = current_app.config['PROFILE_UPLOAD_DIR']
+    # The upload is kept so add_profile can reuse it and its parse cache; orphaned uploads
+    # are swept by cleanup_temp_files once they are older than an hour.
+    saved_path, digest = _save_upload_by_digest(resume, upload_folder)
+    filename = saved_path.name
+    cache_file = _parse_cache_path(upload_folder, digest)
 
     try:
+        # Identical content was already parsed; skip extraction and the AI call entirely
+        if cache_file.exists():
+            cached = _decode_parse_cache(cache_file)
+            if cached is not None:
+                current_app.logger.info('Using cached parse result for %s', filename)
+                return _orjson_response({'success': True, 'data': msgspec.to_builtins(cached), 'saved_filename': filename})
+
         # Extract text from the saved resume file (supports .txt/.pdf/.docx)
         extracted_text = None
         extracted_links = []
@@ -1434,7 +1535,7 @@ def parse_resume_route():
                     if missing_sections:
                         current_app.logger.info(f'AI parsing missing sections: {missing_sections}, attempting merge with local parser')
                         try:
-                            local_raw = parse_resume(str(saved_path))
+                            local_raw = parse_resume_local(saved_path)
                             local_norm = normalize(local_raw)
                             
                             # Merge missing sections from local parser
@@ -1462,7 +1563,7 @@ def parse_resume_route():
         if not parsed:
             try:
                 current_app.logger.info('Using local parser fallback')
-                parsed_raw = parse_resume(str(saved_path))
+                parsed_raw = parse_resume_local(saved_path)
                 parsed = normalize(parsed_raw)
                 current_app.logger.info('Local parser completed successfully')
             except Exception as local_exc:
@@ -1477,8 +1578,10 @@ def parse_resume_route():
         try:
             if 'links' not in parsed or not isinstance(parsed.get('links'), list):
                 parsed['links'] = []
+            seen_links = set(parsed['links'])
             for fl in (extracted_links or []):
-                if fl and fl not in parsed['links']:
+                if fl and fl not in seen_links:
+                    seen_links.add(fl)
                     parsed['links'].append(fl)
         except Exception as merge_links_exc:
             current_app.logger.warning(f'Failed to merge extracted links: {merge_links_exc}')
@@ -1496,27 +1599,17 @@ def parse_resume_route():
         except Exception:
             pass
 
-        # Cache the normalized parse result next to the uploaded file so subsequent handlers reuse it
+        # Cache the normalized parse result under the content digest so subsequent handlers reuse it
         try:
-            cache_file = saved_path.with_name(saved_path.name + '.parsed.json')
-            with cache_file.open('w', encoding='utf-8') as cj:
-                json.dump(parsed, cj)
+            _write_parse_cache(cache_file, parsed)
         except Exception:
             current_app.logger.debug('Failed to write parse cache file', exc_info=True)
 
-        return jsonify({'success': True, 'data': parsed})
+        return _orjson_response({'success': True, 'data': parsed, 'saved_filename': filename})
         
     except Exception as e:
         current_app.logger.error(f'Resume parsing error: {e}', exc_info=True)
         return jsonify({'error': f'An error occurred while parsing the resume: {str(e)}'}), 500
-    finally:
-        # Clean up uploaded file
-        try:
-            if saved_path.exists():
-                saved_path.unlink()
-                current_app.logger.info('Cleaned up temporary file')
-        except Exception as cleanup_exc:
-            current_app.logger.warning(f'Failed to clean up file: {cleanup_exc}')
 
 
 # ================================
@@ -1677,8 +1770,8 @@ def generate_resume_pdf():
         
         current_app.logger.info(f'Generating PDF for profile: {improved_profile.get("name", "Unknown")}')
         
-        # Initialize LaTeX generator
-        latex_generator = LaTeXResumeGenerator()
+        # Shared process-wide LaTeX generator
+        latex_generator = get_latex_generator()
         
         # Generate PDF
         pdf_path = latex_generator.generate_resume_pdf(improved_profile)
@@ -1926,7 +2019,9 @@ def get_batch_results_data():
                 'action_items': job_result.get('analysis', {}).get('action_items', []),
                 'has_improved_resume': bool(improved_resume_path),
                 'improved_resume': resume_content,
-                'improved_profile': _format_profile_for_autofill(job_result.get('improved_profile', {})),  # Formatted job-specific improved profile
+                'improved_profile': _format_profile_for_autofill(  # Formatted job-specific improved profile
+                    job_result.get('improved_profile') or batch_processor.load_improved_profile(job_result)
+                ),
                 'industry_alignment': job_result.get('analysis', {}).get('industry_alignment', ''),
                 'experience_level_match': job_result.get('analysis', {}).get('experience_level_match', '')
             }
@@ -1989,7 +2084,9 @@ def get_batch_results_public(batch_id):
                     'summary': job_result.get('analysis', {}).get('summary', ''),
                     'has_improved_resume': bool(job_result.get('improved_resume_path')),
                     'improved_resume': resume_content,
-                    'improved_profile': _format_profile_for_autofill(job_result.get('improved_profile', {})),
+                    'improved_profile': _format_profile_for_autofill(
+                        job_result.get('improved_profile') or batch_processor.load_improved_profile(job_result)
+                    ),
                     'industry_alignment': job_result.get('analysis', {}).get('industry_alignment', ''),
                     'experience_level_match': job_result.get('analysis', {}).get('experience_level_match', '')
                 }
@@ -2589,7 +2686,7 @@ def cleanup_temp_files():
                         current_app.logger.warning(f'Failed to cleanup batch folder {batch_folder}: {e}')
         
         # Cleanup old parse cache files
-        uploads_dir = Path(current_app.static_folder) / 'uploads' / 'profiles'
+        uploads_dir = current_app.config['PROFILE_UPLOAD_DIR']
         if uploads_dir.exists():
             for cache_file in uploads_dir.glob('*.parsed.json'):
                 if current_time - cache_file.stat().st_mtime > 86400:  # 24 hours
@@ -2599,6 +2696,25 @@ def cleanup_temp_files():
                     except Exception as e:
                         current_app.logger.warning(f'Failed to cleanup parse cache {cache_file}: {e}')
         
+        # Cleanup resume uploads left by the parse endpoint that never became a saved profile.
+        # Files are named by content digest, so a profile's resume shares its name with the upload.
+        if uploads_dir.exists():
+            referenced = {
+                Path(name).name
+                for (name,) in db.session.query(Profile.resume_filename).filter(Profile.resume_filename.isnot(None))
+            }
+            for upload_file in uploads_dir.iterdir():
+                if not upload_file.is_file() or upload_file.name.endswith('.parsed.json'):
+                    continue
+                if not _DIGEST_UPLOAD_RE.match(upload_file.name) or upload_file.name in referenced:
+                    continue
+                if current_time - upload_file.stat().st_mtime > 3600:  # 1 hour
+                    try:
+                        upload_file.unlink()
+                        cleanup_count += 1
+                    except Exception as e:
+                        current_app.logger.warning(f'Failed to cleanup upload {upload_file}: {e}')
+        
         current_app.logger.info(f'Cleanup completed: removed {cleanup_count} old files')
         return cleanup_count
         
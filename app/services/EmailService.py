@@ -1,29 +1,178 @@
-from mailersend import emails
+import asyncio
+import logging
 import os
+import queue
 import re
+import threading
+import time
+import httpx
 from dotenv import load_dotenv
 from email_validator import validate_email, EmailNotValidError
+from functools import lru_cache, partial
+from pathlib import Path
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+from rapidfuzz import fuzz, process
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+MAILERSEND_API_BASE = "https://api.mailersend.com"
+
+# Settings read from the environment once at import
+MAILERSEND_API_KEY = os.getenv("MAILERSEND_API_KEY")
+MAILERSEND_SENDER_EMAIL = os.getenv("MAILERSEND_SENDER_EMAIL")
+MAILERSEND_INBOUND_EMAIL = os.getenv("MAILERSEND_INBOUND_EMAIL")
+# Rates are clamped to at least one request a minute; zero or negative would break _TokenBucket
+MAILERSEND_RPM = max(float(os.getenv("MAILERSEND_RPM", "110")), 1.0)
+MAILERSEND_BULK_RPM = max(float(os.getenv("MAILERSEND_BULK_RPM", "9")), 1.0)
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket. reserve() takes a token and returns how long the caller
+    must wait before using it, so sync and async senders can share one bucket.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+# MailerSend allows 120 requests/minute on v1/email; stay a little under it per process
+_SEND_BUCKET = _TokenBucket(rate=MAILERSEND_RPM / 60.0, capacity=10)
+# v1/bulk-email takes many messages per request but only allows 10 requests/minute
+_BULK_BUCKET = _TokenBucket(rate=MAILERSEND_BULK_RPM / 60.0, capacity=1)
+MAILERSEND_MAX_RETRIES = 2
+# The background outbox collects queued emails for up to this long (or this many) per flush
+OUTBOX_FLUSH_SECONDS = 2.0
+OUTBOX_MAX_BATCH = 500
+
+
+def _retry_after_seconds(response, default=5.0):
+    """Seconds to wait before retrying a 429, from the Retry-After header when present."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+# Email bodies live under app/templates/emails; the environment is independent of the
+# Flask app so the service also works outside a request/app context.
+_EMAIL_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).resolve().parent.parent / 'templates')),
+    autoescape=select_autoescape(['html']),
+    auto_reload=False
+)
+
+
+@lru_cache(maxsize=None)
+def _get_email_template(name):
+    """Return the compiled Jinja template for an email body (compiled once per process)."""
+    return _EMAIL_TEMPLATE_ENV.get_template(name)
+
+
+@lru_cache(maxsize=10_000)
+def _mx_exists(domain):
+    """
+    Check whether a domain can receive email (MX record, falling back to A record).
+    Results are cached per domain; DNS timeouts raise so they are not cached.
+    """
+    import dns.exception
+    import dns.resolver
+
+    resolver = dns.resolver.Resolver()
+    resolver.lifetime = 2.0
+    for record_type in ('MX', 'A'):
+        try:
+            resolver.resolve(domain, record_type)
+            return True
+        except (dns.resolver.NoAnswer, dns.resolver.NoNameservers):
+            continue
+        except dns.resolver.NXDOMAIN:
+            return False
+        except dns.exception.Timeout:
+            # Propagate instead of returning False so lru_cache doesn't remember a transient failure
+            raise
+    return False
+
+
+# Known misspellings of popular providers. Only these exact domains are rejected.
+COMMON_DOMAIN_TYPOS = {
+    'gmail.co': 'gmail.com',
+    'gmail.cm': 'gmail.com',
+    'yahooo.com': 'yahoo.com',
+    'hotmial.com': 'hotmail.com',
+    'gmial.com': 'gmail.com'
+}
+
+# Popular mailbox providers used for advisory "did you mean" hints. Generic names such as
+# mail.com/email.com are left out: too many real domains sit within a couple of edits of them.
+KNOWN_EMAIL_DOMAINS = (
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+    'icloud.com', 'protonmail.com', 'yandex.com',
+)
+_KNOWN_EMAIL_DOMAIN_SET = frozenset(KNOWN_EMAIL_DOMAINS)
+
+
+@lru_cache(maxsize=4096)
+def _suggest_domain(domain):
+    """
+    Return the known provider a domain is a near-miss of, or None.
+
+    This is a hint only; a near-miss can be a real domain (protonmail.ch, bol.com), so callers
+    must never reject an address because of it.
+    """
+    if domain in _KNOWN_EMAIL_DOMAIN_SET:
+        return None
+    match = process.extractOne(domain, KNOWN_EMAIL_DOMAINS, scorer=fuzz.ratio, score_cutoff=90)
+    return match[0] if match else None
+
+
 class EmailService:
+    # Basic email regex pattern
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
     def __init__(self, api_key=''):
         # Set your API key
-        self.api_key = os.getenv("MAILERSEND_API_KEY")
-        self.default_from_email = os.getenv("MAILERSEND_SENDER_EMAIL")
+        self.api_key = api_key or MAILERSEND_API_KEY
+        self.default_from_email = MAILERSEND_SENDER_EMAIL
         self.default_from_name = "CyberCrack Support"
-        #print(self.api_key, self.default_from_email, self.default_from_name)
+        # One pooled HTTP client per service instance so sends reuse the TLS connection
+        self._client = httpx.Client(base_url=MAILERSEND_API_BASE, headers=self._api_headers(), timeout=10)
+        # Outbox drained by a single background thread, started on first queued email
+        self._outbox = queue.Queue()
+        self._outbox_worker = None
+        self._outbox_lock = threading.Lock()
     
     def validate_email(self, email):
         """
         Validate email address format
         """
-        # Basic email regex pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
         if not email or not isinstance(email, str):
             return False, "Email address is required"
         
-        if not re.match(pattern, email):
+        if not self._EMAIL_RE.match(email):
             return False, "Invalid email format"
         
         # Additional checks
@@ -31,81 +180,246 @@ class EmailService:
             return False, "Email address too long"
         
         # Check for common typos in domains
-        common_domains = {
-            'gmail.co': 'gmail.com',
-            'gmail.cm': 'gmail.com',
-            'yahooo.com': 'yahoo.com',
-            'hotmial.com': 'hotmail.com',
-            'gmial.com': 'gmail.com'
-        }
+        local_part, _, domain = email.rpartition('@')
+        domain = domain.lower()
+        if domain in COMMON_DOMAIN_TYPOS:
+            return False, f"Did you mean {local_part}@{COMMON_DOMAIN_TYPOS[domain]}?"
         
-        domain = email.split('@')[-1].lower()
-        if domain in common_domains:
-            return False, f"Did you mean {email.replace(domain, common_domains[domain])}?"
+        # Near-misses of popular providers are accepted; the hint is advisory only
+        suggestion = _suggest_domain(domain)
+        if suggestion:
+            return True, f"Valid email (did you mean {local_part}@{suggestion}?)"
         
         return True, "Valid email"
 
-    def validate_email_with_library(self, email):
+    def validate_email_with_library(self, email, check_deliverability=False):
         """
-        Validate email using email-validator library
+        Validate email using email-validator library.
+
+        Deliverability (DNS) checks are off by default so request handlers don't block
+        on a network round-trip; background jobs can opt in and share the cached lookup.
         """
         try:
-            # Validate and get info about the email
-            validation = validate_email(
-                email,
-                check_deliverability=True  # This checks if the domain can receive email
-            )
+            # Validate syntax and normalize the address
+            validation = validate_email(email, check_deliverability=False)
             
             # The validated email address
-            valid_email = validation.email
+            valid_email = validation.normalized
+
+            if check_deliverability:
+                try:
+                    if not _mx_exists(validation.ascii_domain):
+                        return False, f"The domain {validation.domain} does not accept email"
+                except Exception:
+                    # DNS unavailable or timed out - don't reject the address for it
+                    pass
             
             return True, f"Valid email: {valid_email}"
             
         except EmailNotValidError as e:
             return False, str(e)
 
-    def send_email(self, to_email, to_name, subject, text_content, html_content=None, from_email=None, from_name=None, reply_to=None):
+    def _api_headers(self):
+        return {
+            "Content-Type": "application/json",
+            "X-Requested-With": "XMLHttpRequest",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+
+    def _build_mail_body(self, to_email, to_name, subject, text_content, html_content=None, from_email=None, from_name=None, reply_to=None):
         """
-        Send an email using MailerSend
+        Build the MailerSend request body shared by the sync and async senders
         """
         # Set default sender values if not provided
         from_email = from_email or self.default_from_email
         from_name = from_name or self.default_from_name
 
-        mailer = emails.NewEmail(self.api_key)
-        mail_body = {}
-
-        # Required
-        mailer.set_mail_from({"email": from_email, "name": from_name}, mail_body)
-        mailer.set_mail_to([{"email": to_email, "name": to_name}], mail_body)
-        mailer.set_subject(subject, mail_body)
-        mailer.set_plaintext_content(text_content, mail_body)
+        mail_body = {
+            "from": {"email": from_email, "name": from_name},
+            "to": [{"email": to_email, "name": to_name}],
+            "subject": subject,
+            "text": text_content,
+        }
 
         # Optional
         if html_content:
-            mailer.set_html_content(html_content, mail_body)
+            mail_body["html"] = html_content
         
         # Set reply-to if provided
         if reply_to:
-            mailer.set_reply_to(reply_to, mail_body)
+            mail_body["reply_to"] = reply_to
+
+        return mail_body
+
+    def send_email(self, to_email, to_name, subject, text_content, html_content=None, from_email=None, from_name=None, reply_to=None):
+        """
+        Send an email through the MailerSend REST API
+        """
+        mail_body = self._build_mail_body(to_email, to_name, subject, text_content,
+                                          html_content, from_email, from_name, reply_to)
+
+        try:
+            response = self._post_with_retry('/v1/email', mail_body, _SEND_BUCKET)
+            return {
+                "success": True,
+                "response": response.status_code
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def _post_with_retry(self, path, payload, bucket):
+        for attempt in range(MAILERSEND_MAX_RETRIES + 1):
+            bucket.acquire()
+            response = self._client.post(path, json=payload)
+            if response.status_code != 429 or attempt == MAILERSEND_MAX_RETRIES:
+                break
+            time.sleep(_retry_after_seconds(response))
+        response.raise_for_status()
+        return response
+
+    def send_bulk_email(self, jobs):
+        """
+        Send several emails in one v1/bulk-email request.
 
+        Each job is a dict of send_email keyword arguments. MailerSend queues the
+        messages and reports per-message status asynchronously under the returned id.
+        """
+        payload = [self._build_mail_body(**job) for job in jobs]
         try:
-            response = mailer.send(mail_body)
-            #print(response)
+            response = self._post_with_retry('/v1/bulk-email', payload, _BULK_BUCKET)
             return {
                 "success": True,
-                "response": response
+                "response": response.json().get("bulk_email_id")
             }
         except Exception as e:
-            #print(f"Error sending email: {str(e)}")
             return {
                 "success": False,
                 "error": str(e)
             }
+
+    def _next_outbox_batch(self):
+        batch = [self._outbox.get()]
+        deadline = time.monotonic() + OUTBOX_FLUSH_SECONDS
+        # Emails queued with bulk=False flush right away instead of waiting for a burst
+        while len(batch) < OUTBOX_MAX_BATCH and batch[-1][0]:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._outbox.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _send_outbox_email(self, job):
+        try:
+            result = self.send_email(**job)
+            if not result.get("success"):
+                logger.warning("Background email to %s failed: %s", job.get("to_email"), result.get("error"))
+        except Exception:
+            logger.exception("Background email to %s failed", job.get("to_email"))
+
+    def _drain_outbox(self):
+        while True:
+            batch = self._next_outbox_batch()
+            try:
+                single = [job for bulk, job in batch if not bulk]
+                grouped = [job for bulk, job in batch if bulk]
+                if len(grouped) == 1:
+                    single += grouped
+                elif grouped:
+                    # A burst goes out as one bulk request instead of eating the per-email rate limit
+                    try:
+                        result = self.send_bulk_email(grouped)
+                    except Exception as e:
+                        result = {"success": False, "error": str(e)}
+                    if not result.get("success"):
+                        # Nothing was accepted, so fall back to sending each email on its own
+                        logger.warning("Background bulk email of %d messages failed, retrying individually: %s",
+                                       len(grouped), result.get("error"))
+                        single += grouped
+                for job in single:
+                    self._send_outbox_email(job)
+            finally:
+                for _ in batch:
+                    self._outbox.task_done()
+
+    def send_email_background(self, bulk=True, **kwargs):
+        """
+        Queue an email for delivery by the background sender and return immediately.
+
+        Takes the same keyword arguments as send_email. Emails queued within a couple
+        of seconds of each other are sent together through v1/bulk-email; bulk=False
+        sends the email on its own as soon as the sender reaches it. If a bulk request
+        fails, its emails are retried one by one. Delivery errors are logged rather
+        than returned, so validate the recipient before queueing.
+        """
+        if self._outbox_worker is None:
+            with self._outbox_lock:
+                if self._outbox_worker is None:
+                    worker = threading.Thread(target=self._drain_outbox, name="email-outbox", daemon=True)
+                    worker.start()
+                    self._outbox_worker = worker
+        self._outbox.put((bulk, kwargs))
+        return {
+            "success": True,
+            "queued": True
+        }
+
+    async def send_email_async(self, client, to_email, to_name, subject, text_content, html_content=None, from_email=None, from_name=None, reply_to=None):
+        """
+        Send an email through the MailerSend REST API using a shared httpx.AsyncClient
+        """
+        mail_body = self._build_mail_body(to_email, to_name, subject, text_content,
+                                          html_content, from_email, from_name, reply_to)
+
+        try:
+            for attempt in range(MAILERSEND_MAX_RETRIES + 1):
+                await _SEND_BUCKET.acquire_async()
+                response = await client.post('/v1/email', json=mail_body)
+                if response.status_code != 429 or attempt == MAILERSEND_MAX_RETRIES:
+                    break
+                await asyncio.sleep(_retry_after_seconds(response))
+            response.raise_for_status()
+            return {
+                "success": True,
+                "response": response.status_code
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    async def _send_bulk_async(self, jobs, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(base_url=MAILERSEND_API_BASE, headers=self._api_headers(), timeout=10) as client:
+            async def send_one(job):
+                async with semaphore:
+                    return await self.send_email_async(client, **job)
+
+            return await asyncio.gather(*(send_one(job) for job in jobs))
+
+    def send_bulk(self, jobs, concurrency=16):
+        """
+        Send several emails concurrently over one HTTP connection pool.
+
+        Each job is a dict of send_email keyword arguments. Returns the per-email
+        result dicts in the same order as jobs.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        return asyncio.run(self._send_bulk_async(jobs, concurrency))
             
-    def send_license_email(self, to_email, to_name, license_key, order_id, valid_hours=1):
+    def send_license_email(self, to_email, to_name, license_key, order_id, valid_hours=1, background=False):
         """
-        Send an email containing the license key after successful payment
+        Send an email containing the license key after successful payment.
+        With background=True the email is queued and the call returns immediately.
         """
         # Ensure valid_hours is an integer
         valid_hours = int(valid_hours) if valid_hours else 1
@@ -149,96 +463,16 @@ The CyberCrack Team
 """
         
         # HTML version of the email
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-        .header {{ background-color: #00b4d8; color: white; padding: 20px; text-align: center; }}
-        .content {{ padding: 20px; }}
-        .license-key {{ background-color: #f0f0f0; padding: 15px; margin: 20px 0; font-family: monospace; font-size: 16px; word-break: break-all; }}
-        .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        .button {{ 
-            background-color: #00b4d8; 
-            color: white; 
-            padding: 12px 24px; 
-            text-decoration: none; 
-            border-radius: 5px; 
-            display: inline-block;
-            font-weight: bold;
-            margin: 10px 0;
-        }}
-        .button:hover {{ background-color: #0099b8; }}
-        .support-link {{ 
-            color: #00b4d8; 
-            text-decoration: none; 
-            font-weight: bold;
-        }}
-        .support-link:hover {{ text-decoration: underline; }}
-        .contact-section {{ 
-            background-color: #f8f9fa; 
-            padding: 15px; 
-            margin: 20px 0; 
-            border-radius: 5px; 
-            border-left: 4px solid #00b4d8;
-        }}
-        .license-info {{ 
-            background-color: #e8f4fd; 
-            padding: 15px; 
-            margin: 20px 0; 
-            border-radius: 5px; 
-            border-left: 4px solid #00b4d8;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>CyberCrack License Key</h1>
-        </div>
-        <div class="content">
-            <h2>Hello {to_name},</h2>
-            <p>Thank you for purchasing CyberCrack! Your license key is ready.</p>
-            
-            <div class="license-info">
-                <h3>Your License Details</h3>
-                <p><strong>Order ID:</strong> {order_id}</p>
-                <p><strong>Valid for:</strong> {hours_text}</p>
-            </div>
-            
-            <div class="license-key">
-                {license_key}
-            </div>
-            
-            <h3>Installation Instructions:</h3>
-            <ol>
-                <li>Download the CyberCrack software from our website</li>
-                <li>Run the installer and follow the on-screen instructions</li>
-                <li>When prompted, enter your license key</li>
-            </ol>
-            
-            <p>Your license is valid for {hours_text} from activation.</p>
-            
-            <div class="contact-section">
-                <p>If you have any questions or need assistance, please contact our support team at <a href="mailto:cybercrack@sbmtechpro.com" class="support-link">cybercrack@sbmtechpro.com</a>.</p>
-            </div>
-            
-            <div style="text-align: center; margin: 20px 0;">
-                <a href="https://getcybercrack.com/" class="button">Download Software</a>
-            </div>
-        </div>
-        <div class="footer">
-            <p>Thank you for choosing CyberCrack!</p>
-            <p>&copy; 2025 CyberCrack. All rights reserved.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        html_content = _get_email_template('emails/license.html').render(
+            to_name=to_name,
+            license_key=license_key,
+            order_id=order_id,
+            hours_text=hours_text
+        )
         
-        return self.send_email(
+        # License keys are never held back to be grouped with other emails
+        send = partial(self.send_email_background, bulk=False) if background else self.send_email
+        return send(
             to_email=to_email,
             to_name=to_name,
             subject=subject,
@@ -246,9 +480,10 @@ The CyberCrack Team
             html_content=html_content
         )
     
-    def send_contact_email(self, from_email, from_name, message):
+    def send_contact_email(self, from_email, from_name, message, background=False):
         """
-        Send a contact form email to the support team using the inbound route
+        Send a contact form email to the support team using the inbound route.
+        With background=True the email is queued and the call returns immediately.
         """
         subject = f"CyberCrack Contact Form - {from_name}"
         
@@ -268,60 +503,21 @@ Reply directly to this email to respond to the customer.
 """
         
         # HTML version of the email
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-        .header {{ background-color: #00b4d8; color: white; padding: 20px; text-align: center; }}
-        .content {{ padding: 20px; }}
-        .contact-info {{ background-color: #f8f9fa; padding: 15px; margin: 20px 0; border-left: 4px solid #00b4d8; }}
-        .message {{ background-color: #f0f0f0; padding: 15px; margin: 20px 0; border-radius: 5px; }}
-        .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; color: #666; }}
-        .reply-info {{ background-color: #e8f4fd; padding: 10px; margin: 20px 0; border-radius: 5px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>CyberCrack Contact Form</h1>
-        </div>
-        <div class="content">
-            <h2>New Contact Form Submission</h2>
-            
-            <div class="contact-info">
-                <h3>Customer Information</h3>
-                <p><strong>Name:</strong> {from_name}</p>
-                <p><strong>Email:</strong> {from_email}</p>
-            </div>
-            
-            <h3>Message:</h3>
-            <div class="message">
-                {message.replace(chr(10), '<br>')}
-            </div>
-            
-            <div class="reply-info">
-                <p><strong>Note:</strong> Reply directly to this email to respond to the customer.</p>
-            </div>
-        </div>
-        <div class="footer">
-            <p>This email was sent from the CyberCrack contact form</p>
-            <p>© 2025 CyberCrack. All rights reserved.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        html_content = _get_email_template('emails/contact.html').render(
+            from_name=from_name,
+            from_email=from_email,
+            # Escape customer input before turning newlines into line breaks
+            message_html=Markup('<br>').join(escape(message).split('\n'))
+        )
         
         # Use the correct inbound email address from the configuration
-        inbound_email = os.getenv("MAILERSEND_INBOUND_EMAIL")
+        inbound_email = MAILERSEND_INBOUND_EMAIL
         
         # Set reply-to to the customer's email
         reply_to = {"email": from_email, "name": from_name}
         
-        return self.send_email(
+        send = self.send_email_background if background else self.send_email
+        return send(
             to_email=inbound_email,  # Send to inbound route
             to_name="CyberCrack Support",
             subject=subject,
@@ -330,9 +526,10 @@ Reply directly to this email to respond to the customer.
             reply_to=reply_to
         )
 
-    def send_admin_license_email(self, to_email, to_name, license_key, order_id, valid_hours=1):
+    def send_admin_license_email(self, to_email, to_name, license_key, order_id, valid_hours=1, background=False):
         """
-        Send an email containing the license key for admin-generated licenses
+        Send an email containing the license key for admin-generated licenses.
+        With background=True the email is queued and the call returns immediately.
         """
         # Ensure valid_hours is an integer
         valid_hours = int(valid_hours) if valid_hours else 1
@@ -376,98 +573,16 @@ The CyberCrack Team
 """
         
         # HTML version of the email
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-        .header {{ background-color: #ff9800; color: white; padding: 20px; text-align: center; }}
-        .admin-badge {{ background-color: #f57c00; padding: 5px 15px; border-radius: 20px; font-size: 12px; font-weight: bold; display: inline-block; margin-bottom: 10px; }}
-        .content {{ padding: 20px; }}
-        .license-key {{ background-color: #f0f0f0; padding: 15px; margin: 20px 0; font-family: monospace; font-size: 16px; word-break: break-all; }}
-        .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        .button {{ 
-            background-color: #ff9800; 
-            color: white; 
-            padding: 12px 24px; 
-            text-decoration: none; 
-            border-radius: 5px; 
-            display: inline-block;
-            font-weight: bold;
-            margin: 10px 0;
-        }}
-        .button:hover {{ background-color: #f57c00; }}
-        .support-link {{ 
-            color: #ff9800; 
-            text-decoration: none; 
-            font-weight: bold;
-        }}
-        .support-link:hover {{ text-decoration: underline; }}
-        .contact-section {{ 
-            background-color: #f8f9fa; 
-            padding: 15px; 
-            margin: 20px 0; 
-            border-radius: 5px; 
-            border-left: 4px solid #ff9800;
-        }}
-        .license-info {{ 
-            background-color: #fff3e0; 
-            padding: 15px; 
-            margin: 20px 0; 
-            border-radius: 5px; 
-            border-left: 4px solid #ff9800;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div class="admin-badge">ADMIN GENERATED</div>
-            <h1>CyberCrack License Key</h1>
-        </div>
-        <div class="content">
-            <h2>Hello {to_name},</h2>
-            <p>Your CyberCrack license has been generated by an administrator.</p>
-            
-            <div class="license-info">
-                <h3>Your License Details</h3>
-                <p><strong>Order ID:</strong> {order_id}</p>
-                <p><strong>Valid for:</strong> {hours_text}</p>
-            </div>
-            
-            <div class="license-key">
-                {license_key}
-            </div>
-            
-            <h3>Installation Instructions:</h3>
-            <ol>
-                <li>Download the CyberCrack software from our website</li>
-                <li>Run the installer and follow the on-screen instructions</li>
-                <li>When prompted, enter your license key</li>
-            </ol>
-            
-            <p>Your license is valid for {hours_text} from activation.</p>
-            
-            <div class="contact-section">
-                <p>If you have any questions or need assistance, please contact our support team at <a href="mailto:cybercrack@sbmtechpro.com" class="support-link">cybercrack@sbmtechpro.com</a>.</p>
-            </div>
-            
-            <div style="text-align: center; margin: 20px 0;">
-                <a href="https://getcybercrack.com/" class="button">Download Software</a>
-            </div>
-        </div>
-        <div class="footer">
-            <p>Thank you for choosing CyberCrack!</p>
-            <p>&copy; 2025 CyberCrack. All rights reserved.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        html_content = _get_email_template('emails/admin_license.html').render(
+            to_name=to_name,
+            license_key=license_key,
+            order_id=order_id,
+            hours_text=hours_text
+        )
         
-        return self.send_email(
+        # License keys are never held back to be grouped with other emails
+        send = partial(self.send_email_background, bulk=False) if background else self.send_email
+        return send(
             to_email=to_email,
             to_name=to_name,
             subject=subject,
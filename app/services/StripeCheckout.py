@@ -1,17 +1,35 @@
 import stripe
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 load_dotenv()
 STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY")
 
+_CURRENCY = 'usd'
+
+
+@lru_cache(maxsize=64)
+def _product_data(hours):
+    """Stripe product_data for a license of the given length (built once per hours value)."""
+    hours_text = f"{hours} hour{'s' if hours > 1 else ''}"
+    return {
+        'name': f'CyberCrack License ({hours_text})',
+        'description': f'AI Security Interview Preparation Software - {hours_text} license',
+    }
+
+
 class StripeCheckout:
+    # The HTTP client is process-wide in the stripe library; install a keep-alive one once
+    _http_client_configured = False
+
     def __init__(self, api_key=None):
         """Initialize the Stripe checkout service with an API key"""
-        self.api_key = api_key or os.environ.get(
-            'STRIPE_SECRET_KEY', 
-            STRIPE_SECRET_KEY
-        )
+        self.api_key = api_key or STRIPE_SECRET_KEY
         stripe.api_key = self.api_key
+        if not StripeCheckout._http_client_configured:
+            # Pooled requests session so checkouts reuse the TLS connection to api.stripe.com
+            stripe.default_http_client = stripe.RequestsClient(timeout=10)
+            StripeCheckout._http_client_configured = True
     
     def create_session(self, name, email, amount=999, success_url=None, cancel_url=None, hours=1):
         """Create a Stripe checkout session"""
@@ -19,20 +37,13 @@ class StripeCheckout:
             # Ensure hours is an integer
             hours = int(hours) if hours else 1
             
-            # Format product description based on hours
-            hours_text = f"{hours} hour{'s' if hours > 1 else ''}"
-            product_description = f'AI Security Interview Preparation Software - {hours_text} license'
-            
             checkout_session = stripe.checkout.Session.create(
                 payment_method_types=['card'],
                 line_items=[
                     {
                         'price_data': {
-                            'currency': 'usd',
-                            'product_data': {
-                                'name': f'CyberCrack License ({hours_text})',
-                                'description': product_description,
-                            },
+                            'currency': _CURRENCY,
+                            'product_data': _product_data(hours),
                             'unit_amount': int(amount),
                         },
                         'quantity': 1,
@@ -57,4 +68,10 @@ class StripeCheckout:
             session = stripe.checkout.Session.retrieve(session_id)
             return session
         except stripe.error.StripeError as e:
-            raise e
\ No newline at end of file
+            raise e
+
+
+@lru_cache(maxsize=1)
+def get_checkout():
+    """Return the shared StripeCheckout instance for this process."""
+    return StripeCheckout()
@@ -10,11 +10,23 @@ Notes:
 """
 
 import os
+import re
 import json
+import orjson
+import asyncio
 import logging
+import hashlib
+import threading
+import time
+import concurrent.futures
+from collections import OrderedDict
+from functools import lru_cache
+from string import Template
 from typing import Any, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pathlib import Path
 
@@ -27,12 +39,24 @@ except Exception:
 
 # Local fallback parser (heuristic) reused
 try:
-    from app.services.resume_parser import parse_resume as local_parse_resume
+    from app.services.resume_parser import parse_resume_text_fallback as local_parse_resume_text
 except Exception:
-    local_parse_resume = None
+    local_parse_resume_text = None
 
 LOGGER = logging.getLogger(__name__)
 
+# Patterns used by _safe_json_parse, compiled once
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```', re.IGNORECASE | re.DOTALL)  # ```json ... ``` or ``` ... ```
+_JSON_TAG_RE = re.compile(r'<json>([\s\S]*?)</json>', re.IGNORECASE | re.DOTALL)          # <json> ... </json>
+_JSON_PREFIX_RE = re.compile(r'JSON:\s*([\s\S]*?)(?:\n\n|\Z)', re.IGNORECASE | re.DOTALL)  # JSON: ... (until double newline or end)
+# Markers of a short, cleanly sectioned resume that the local heuristics handle well
+STRUCTURED_RESUME_MAX_CHARS = 2048
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+_EXPERIENCE_HEADER_RE = re.compile(r'^\s*(?:work |professional )?experience\b', re.IGNORECASE | re.MULTILINE)
+_SKILLS_HEADER_RE = re.compile(r'^\s*(?:technical )?skills\b', re.IGNORECASE | re.MULTILINE)
+_KEY_QUOTE_RE = re.compile(r"'([^']*)':")
+_VAL_QUOTE_RE = re.compile(r":\s*'([^']*)'")
+
 
 def _safe_json_parse(text_data):
     """Safely parse JSON from various text formats with multiple fallback strategies."""
@@ -43,51 +67,46 @@ def _safe_json_parse(text_data):
     
     # Strategy 1: Direct JSON parsing
     try:
-        return json.loads(text_data)
-    except (json.JSONDecodeError, ValueError):
+        return orjson.loads(text_data)
+    except orjson.JSONDecodeError:
         pass
     
     # Strategy 2: Extract from code blocks
-    import re
-    patterns = [
-        r'```(?:json)?\s*([\s\S]*?)\s*```',  # ```json ... ``` or ``` ... ```
-        r'<json>([\s\S]*?)</json>',          # <json> ... </json>
-        r'JSON:\s*([\s\S]*?)(?:\n\n|\Z)',    # JSON: ... (until double newline or end)
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text_data, re.IGNORECASE | re.DOTALL)
+    for pattern in (_CODE_BLOCK_RE, _JSON_TAG_RE, _JSON_PREFIX_RE):
+        match = pattern.search(text_data)
         if match:
             candidate = match.group(1).strip()
             try:
-                return json.loads(candidate)
-            except (json.JSONDecodeError, ValueError):
+                return orjson.loads(candidate)
+            except orjson.JSONDecodeError:
                 continue
     
-    # Strategy 3: Find JSON object boundaries
+    # Strategy 3: Find JSON object boundaries, jumping between braces with str.find
+    # (memchr) instead of walking every character
+    start_idx = text_data.find('{')
+    i = start_idx
     brace_count = 0
-    start_idx = -1
-    
-    for i, char in enumerate(text_data):
-        if char == '{':
-            if start_idx == -1:
-                start_idx = i
-            brace_count += 1
-        elif char == '}':
-            brace_count -= 1
-            if brace_count == 0 and start_idx != -1:
-                candidate = text_data[start_idx:i+1]
-                try:
-                    return json.loads(candidate)
-                except (json.JSONDecodeError, ValueError):
-                    start_idx = -1
-                    continue
+    while i != -1:
+        brace_count += 1 if text_data[i] == '{' else -1
+        if brace_count == 0:
+            try:
+                return orjson.loads(text_data[start_idx:i + 1])
+            except orjson.JSONDecodeError:
+                start_idx = i = text_data.find('{', i + 1)
+                continue
+        next_open = text_data.find('{', i + 1)
+        next_close = text_data.find('}', i + 1)
+        if next_open == -1 or (next_close != -1 and next_close < next_open):
+            i = next_close
+        else:
+            i = next_open
     
-    # Strategy 4: Fix common JSON issues and retry
+    # Strategy 4: Fix common JSON issues and retry (stdlib json, as the input is only
+    # loosely repaired)
     try:
         # Replace single quotes with double quotes (carefully)
-        fixed_text = re.sub(r"'([^']*)':", r'"\1":', text_data)  # Fix keys
-        fixed_text = re.sub(r":\s*'([^']*)'", r': "\1"', fixed_text)  # Fix values
+        fixed_text = _KEY_QUOTE_RE.sub(r'"\1":', text_data)  # Fix keys
+        fixed_text = _VAL_QUOTE_RE.sub(r': "\1"', fixed_text)  # Fix values
         return json.loads(fixed_text)
     except (json.JSONDecodeError, ValueError):
         pass
@@ -95,53 +114,95 @@ def _safe_json_parse(text_data):
     return {'raw': text_data}
 
 
+# One long-lived event loop on a daemon thread runs async provider calls for sync callers,
+# instead of building and tearing down a loop (and an executor) per parse.
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+ASYNC_PROVIDER_TIMEOUT = 30  # seconds
+
+
+def _get_background_loop():
+    global _LOOP
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='ai-parser-loop', daemon=True).start()
+                _LOOP = loop
+    return _LOOP
+
+
+def _run_coroutine(coro, timeout=ASYNC_PROVIDER_TIMEOUT):
+    """Run a coroutine on the background loop and block until it finishes."""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        # Cancel the task on the loop too, or it keeps running (and holding its connection)
+        future.cancel()
+        raise
+
+
 # Support two config modes:
 # 1) Use internal GroqProvider (recommended): set GROQ_API_KEY env var
 # 2) Use external HTTP endpoint: set GROQ_API_URL and optionally GROQ_API_KEY
 GROQ_API_URL = os.environ.get('GROQ_API_URL')
 GROQ_API_KEY = os.environ.get('GROQ_API_KEY')
 GROQ_TIMEOUT = float(os.environ.get('GROQ_TIMEOUT_SECONDS', '15'))
+GROQ_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+# Cap concurrent outbound AI parses per process; callers that can't get a slot in time
+# fall back to the local parser instead of piling up blocked threads
+GROQ_MAX_CONCURRENCY = int(os.environ.get('GROQ_MAX_CONCURRENCY', '8'))
+GROQ_SLOT_WAIT_SECONDS = 30
+_GROQ_SLOTS = threading.BoundedSemaphore(GROQ_MAX_CONCURRENCY)
 
 
-def parse_text_via_groq_http(text: str) -> Dict[str, Any]:
-    if not GROQ_API_URL:
-        raise RuntimeError('GROQ_API_URL not configured')
-
-    headers = {
-        'Content-Type': 'application/json'
-    }
+def _build_groq_session():
+    """Pooled session for the GROQ HTTP endpoint with auth headers set once."""
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset({'POST'}))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Content-Type'] = 'application/json'
     if GROQ_API_KEY:
         if GROQ_API_KEY.lower().startswith('bearer '):
-            headers['Authorization'] = GROQ_API_KEY
+            session.headers['Authorization'] = GROQ_API_KEY
         else:
-            headers['Authorization'] = f'Bearer {GROQ_API_KEY}'
+            session.headers['Authorization'] = f'Bearer {GROQ_API_KEY}'
+    return session
+
+
+_SESSION = _build_groq_session()
+
+
+def parse_text_via_groq_http(text: str) -> Dict[str, Any]:
+    if not GROQ_API_URL:
+        raise RuntimeError('GROQ_API_URL not configured')
 
     payload = {'text': text}
-    resp = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=GROQ_TIMEOUT)
-    resp.raise_for_status()
+    # Stream the body into one buffer (orjson parses a bytearray in place) and cap its size
+    # so a runaway response can't balloon worker memory
+    with _SESSION.post(GROQ_API_URL, json=payload, timeout=GROQ_TIMEOUT, stream=True) as resp:
+        resp.raise_for_status()
+        body = bytearray()
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            body += chunk
+            if len(body) > GROQ_MAX_RESPONSE_BYTES:
+                raise ValueError(f'GROQ response exceeded {GROQ_MAX_RESPONSE_BYTES} bytes')
     try:
-        return resp.json()
-    except ValueError:
-        return {'raw': resp.text}
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return {'raw': body.decode('utf-8', errors='replace')}
 
 
-def parse_text(text: str) -> Dict[str, Any]:
-    """Parse resume text using AI providers with robust error handling and fallbacks."""
-    if not text or not isinstance(text, str):
-        return {'raw': str(text) if text else ''}
-    
-    text = text.strip()
-    if not text:
-        return {'raw': ''}
-    
-    # Prefer internal GroqProvider if available and API key present
-    if GroqProvider is not None and (GROQ_API_KEY or os.environ.get('GROQ_API_KEY')):
-        try:
-            provider = GroqProvider(api_key=GROQ_API_KEY)
-            
-            # Create a detailed prompt for better results
-            prompt = f"""Parse this resume text into a JSON object with the following structure:
-{{
+# Prompts sent to the GroqProvider; only the resume text varies per call. Short resumes get
+# a compact key list instead of the annotated example, which is most of the prompt's tokens.
+SHORT_RESUME_CHARS = 500
+
+_RESUME_PROMPT = Template("""Parse this resume text into a JSON object with the following structure:
+{
   "title": "professional title",
   "name": "full name",
   "email": "email address", 
@@ -151,58 +212,160 @@ def parse_text(text: str) -> Dict[str, Any]:
   "summary": "professional summary text",
   "skills": ["skill1", "skill2", "skill3"],
   "work_experience": [
-    {{
+    {
       "title": "job title",
       "company": "company name", 
       "start": "start date",
       "end": "end date or Present",
       "description": "job responsibilities and achievements"
-    }}
+    }
   ],
   "education": [
-    {{
+    {
       "school": "school name",
       "degree": "degree name",
       "start": "start year", 
       "end": "end year",
       "description": "additional details"
-    }}
+    }
   ],
   "projects": [
-    {{
+    {
       "title": "project name",
       "link": "project url if available",
       "description": "project description"
-    }}
+    }
   ],
   "certifications": ["cert1", "cert2"],
   "languages": ["language1", "language2"], 
   "links": ["url1", "url2"],
   "extracted_keywords": ["keyword1", "keyword2"]
-}}
+}
 
 Resume text:
-{text}
+${text}
+
+Return only valid JSON, no additional text or formatting.""")
+
+_RESUME_PROMPT_SHORT = Template("""Parse this resume text into a JSON object with keys: title, name, email, phone, headline, location, summary (strings); skills, certifications, languages, links, extracted_keywords (lists of strings); work_experience (list of {title, company, start, end, description}); education (list of {school, degree, start, end, description}); projects (list of {title, link, description}). Use null or [] when absent.
+
+Resume text:
+${text}
+
+Return only valid JSON, no additional text or formatting.""")
+
 
-Return only valid JSON, no additional text or formatting."""
+# Memo of structured parse results keyed on a digest of the resume text, so re-uploads and
+# retries of the same resume don't hit the LLM again. LRU-ordered with a per-entry TTL.
+PARSE_CACHE_SIZE = 1024
+PARSE_CACHE_TTL = 3600  # seconds
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _parse_cache_get(key):
+    with _PARSE_CACHE_LOCK:
+        entry = _PARSE_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, parsed = entry
+        if time.monotonic() - stored_at > PARSE_CACHE_TTL:
+            del _PARSE_CACHE[key]
+            return None
+        _PARSE_CACHE.move_to_end(key)
+        return parsed
+
+
+def _parse_cache_put(key, parsed):
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = (time.monotonic(), parsed)
+        _PARSE_CACHE.move_to_end(key)
+        while len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+
+
+def _looks_structured(text: str) -> bool:
+    """True for short resumes with an email and explicit Experience and Skills headers."""
+    return (
+        len(text) < STRUCTURED_RESUME_MAX_CHARS
+        and _EMAIL_RE.search(text) is not None
+        and _EXPERIENCE_HEADER_RE.search(text) is not None
+        and _SKILLS_HEADER_RE.search(text) is not None
+    )
+
+
+def parse_text(text: str) -> Dict[str, Any]:
+    """Parse resume text using AI providers with robust error handling and fallbacks."""
+    if not text or not isinstance(text, str):
+        return {'raw': str(text) if text else ''}
+    
+    text = text.strip()
+    if not text:
+        return {'raw': ''}
+
+    # Easy, clearly sectioned resumes don't need the LLM round trip
+    if local_parse_resume_text is not None and _looks_structured(text):
+        try:
+            return local_parse_resume_text(text)
+        except Exception as local_exc:
+            LOGGER.warning(f'Local parser short-circuit failed: {local_exc}', exc_info=True)
+
+    key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    cached = _parse_cache_get(key)
+    if cached is not None:
+        return dict(cached)
+
+    parsed = None
+    if _GROQ_SLOTS.acquire(timeout=GROQ_SLOT_WAIT_SECONDS):
+        try:
+            parsed = _parse_text_via_ai(text)
+        finally:
+            _GROQ_SLOTS.release()
+    else:
+        LOGGER.warning('All %d AI parse slots busy, using local parser', GROQ_MAX_CONCURRENCY)
+    if parsed is not None:
+        # Only remember structured AI results; raw output should be retried next time
+        if isinstance(parsed, dict) and parsed and 'raw' not in parsed:
+            _parse_cache_put(key, parsed)
+            return dict(parsed)
+        return parsed
+
+    # Local fallback to heuristic parser, run directly on the text (no temp file round trip)
+    if local_parse_resume_text is not None:
+        try:
+            parsed = local_parse_resume_text(text)
+            LOGGER.info("Used local parser fallback")
+            return parsed
+        except Exception as local_exc:
+            LOGGER.warning(f'Local parser fallback failed: {local_exc}', exc_info=True)
+
+    # Final fallback - return raw text
+    LOGGER.warning('All parsing methods failed, returning raw text')
+    return {'raw': text}
+
+
+@lru_cache(maxsize=1)
+def _get_provider():
+    """Shared GroqProvider, so parses reuse its client's connection pool."""
+    return GroqProvider(api_key=GROQ_API_KEY)
+
+
+def _parse_text_via_ai(text: str):
+    """Parse with the configured AI provider; returns None when none is available or all fail."""
+    # Prefer internal GroqProvider if available and API key present
+    if GroqProvider is not None and GROQ_API_KEY:
+        try:
+            provider = _get_provider()
+            
+            template = _RESUME_PROMPT_SHORT if len(text) < SHORT_RESUME_CHARS else _RESUME_PROMPT
+            prompt = template.substitute(text=text)
 
             # Handle async provider call safely
             result = provider(prompt)
             
             if hasattr(result, '__await__'):
-                import asyncio
                 try:
-                    # Check if we're already in an event loop
-                    try:
-                        loop = asyncio.get_running_loop()
-                        # We're in an event loop, create a new thread to run the coroutine
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(asyncio.run, result)
-                            raw = future.result(timeout=30)  # 30 second timeout
-                    except RuntimeError:
-                        # No event loop running, safe to use asyncio.run
-                        raw = asyncio.run(result)
+                    raw = _run_coroutine(result)
                 except Exception as async_exc:
                     LOGGER.error(f'Async execution failed: {async_exc}')
                     raise
@@ -227,34 +390,7 @@ Return only valid JSON, no additional text or formatting."""
         except Exception as exc:
             LOGGER.exception('GROQ HTTP API call failed, falling back to local parser: %s', exc)
 
-    # Local fallback to heuristic parser
-    if local_parse_resume is not None:
-        try:
-            from tempfile import NamedTemporaryFile
-            import os
-            
-            # Create temporary file with proper cleanup
-            with NamedTemporaryFile('w', encoding='utf-8', delete=False, suffix='.txt') as tmp:
-                tmp.write(text)
-                tmp_path = tmp.name
-            
-            try:
-                parsed = local_parse_resume(tmp_path)
-                LOGGER.info("Used local parser fallback")
-                return parsed
-            finally:
-                # Ensure cleanup
-                try:
-                    os.unlink(tmp_path)
-                except (OSError, FileNotFoundError):
-                    pass
-                    
-        except Exception as local_exc:
-            LOGGER.warning(f'Local parser fallback failed: {local_exc}', exc_info=True)
-
-    # Final fallback - return raw text
-    LOGGER.warning('All parsing methods failed, returning raw text')
-    return {'raw': text}
+    return None
 
 
 if __name__ == '__main__':
@@ -5,32 +5,138 @@ This service handles batch processing of multiple jobs for resume improvement.
 """
 
 import os
+import re
+import asyncio
 import json
 import logging
 import uuid
+import hashlib
+import sqlite3
+import time
+from dataclasses import asdict
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 import threading
 
-from app.services.resume_improver import ResumeImprover
-from app.services.latex_resume_generator import LaTeXResumeGenerator
+import orjson
+
+from app.services.resume_improver import ResumeImprover, ResumeAnalysis, ImprovementSuggestion
+from app.services.latex_resume_generator import LaTeXResumeGenerator, get_latex_generator
 
 logger = logging.getLogger(__name__)
 
 
+def _utc_now_iso() -> str:
+    """Timezone-aware replacement for the deprecated datetime.utcnow().isoformat()"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+# Characters stripped from job IDs and PDF filenames
+_JOB_ID_RE = re.compile(r'[^\w\-_]')
+_FILENAME_RE = re.compile(r'[^\w\s\-_]')
+
+# Jobs analyzed per LLM prompt; keeps each response well inside the token limit
+ANALYSIS_BATCH_SIZE = 4
+
+# Where each batch's PDFs and results are written
+BATCH_RESULTS_DIR = Path("instance/tmp/job_applications")
+
+# On-disk cache of analyses and improved profiles keyed by (profile, job description)
+LLM_CACHE_PATH = Path("instance/tmp/llm_cache.sqlite3")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Consecutive network-level LLM failures after which the rest of a batch is cancelled
+FAIL_FAST_THRESHOLD = 5
+
+# Minimum spacing between progress callbacks; job_results are fetched via get_batch_results
+PROGRESS_INTERVAL_SECONDS = 0.25
+
+# Concurrent LLM requests per batch; the work is almost entirely waiting on the API
+DEFAULT_MAX_WORKERS = 16
+BATCH_RESUME_MAX_WORKERS = int(os.getenv("BATCH_RESUME_MAX_WORKERS", str(DEFAULT_MAX_WORKERS)))
+
+
+class _LLMResultCache:
+    """Thin thread-safe SQLite key/value store with one namespace per cached stage"""
+
+    def __init__(self, path: Path, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        if not row or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any):
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (namespace, key, value, created_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, time.time())
+            )
+            self._conn.commit()
+
+
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[_LLMResultCache]:
+    """Open the shared result cache once per process; None if the store is unavailable"""
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                try:
+                    _llm_cache = _LLMResultCache(LLM_CACHE_PATH, LLM_CACHE_TTL_SECONDS)
+                except Exception as e:
+                    logger.warning(f"LLM result cache disabled: {e}")
+                    _llm_cache = False
+    return _llm_cache or None
+
+
 class BatchResumeImprover:
     """Service for batch processing resume improvements against multiple job descriptions"""
 
     def __init__(self, resume_improver: Optional[ResumeImprover] = None,
-                 latex_generator: Optional[LaTeXResumeGenerator] = None):
-        """Initialize the batch resume improver"""
+                 latex_generator: Optional[LaTeXResumeGenerator] = None,
+                 max_workers: Optional[int] = None,
+                 concurrency_limit: Optional[asyncio.Semaphore] = None,
+                 fail_fast: bool = True):
+        """
+        Initialize the batch resume improver
+
+        Args:
+            max_workers: Maximum concurrent LLM requests per batch; defaults to BATCH_RESUME_MAX_WORKERS
+            concurrency_limit: Optional semaphore bounding in-flight LLM calls, e.g. shared
+                across batches on one event loop to respect a provider's rate limit
+            fail_fast: Cancel jobs still waiting on the LLM once FAIL_FAST_THRESHOLD calls
+                in a row fail with connection errors, instead of timing out on each one
+        """
         self.resume_improver = resume_improver or ResumeImprover()
-        self.latex_generator = latex_generator or LaTeXResumeGenerator()
-        # Optimize for I/O bound operations (AI calls, PDF generation)
-        # Use more threads than CPU cores since operations are mostly waiting
-        self.max_workers = min(6, (os.cpu_count() or 2) + 2)  # More threads for I/O bound work
+        self.latex_generator = latex_generator or get_latex_generator()
+        self._analysis_cache = get_llm_cache()
+        self.max_workers = max(1, max_workers or BATCH_RESUME_MAX_WORKERS)
+        self.concurrency_limit = concurrency_limit
+        self.fail_fast = fail_fast
+        # pdflatex is CPU-bound, so the PDF stage gets its own pool sized to the cores
+        self.pdf_workers = os.cpu_count() or 2
 
     def process_jobs_batch(self, profile_data: Dict[str, Any],
                           selected_jobs: List[Dict[str, Any]],
@@ -41,11 +147,23 @@ class BatchResumeImprover:
         Args:
             profile_data: User's profile data
             selected_jobs: List of selected job dictionaries
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for rate-limited progress updates, called with
+                (percent, snapshot of the batch counters)
 
         Returns:
             Dictionary containing batch processing results
         """
+        return asyncio.run(self.process_jobs_batch_async(profile_data, selected_jobs, progress_callback))
+
+    async def process_jobs_batch_async(self, profile_data: Dict[str, Any],
+                                       selected_jobs: List[Dict[str, Any]],
+                                       progress_callback: Optional[callable] = None) -> Dict[str, Any]:
+        """
+        Async implementation of process_jobs_batch
+
+        LLM calls are coroutines on the provider's async HTTP client, bounded by a semaphore;
+        only the CPU/subprocess-bound PDF stage runs on worker threads.
+        """
         batch_id = str(uuid.uuid4())
         results = {
             'batch_id': batch_id,
@@ -55,66 +173,186 @@ class BatchResumeImprover:
             'failed_jobs': 0,
             'job_results': [],
             'user_profile': profile_data,  # Store the user's profile data
-            'created_at': datetime.utcnow().isoformat(),
+            'created_at': _utc_now_iso(),
             'status': 'processing'
         }
 
         logger.info(f"Starting batch processing for {len(selected_jobs)} jobs, batch_id: {batch_id}")
 
-        # Process jobs concurrently
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all jobs for processing
-            future_to_job = {}
-            for i, job in enumerate(selected_jobs):
-                # Create a clean job ID from URL or use index
-                job_url = job.get('job_url', '')
-                if job_url:
-                    # Extract a clean identifier from URL
-                    import re
-                    job_id = re.sub(r'[^\w\-_]', '_', job_url.split('/')[-1])[:50]
-                    if not job_id or job_id == '_':
-                        job_id = f"job_{i}"
-                else:
+        # Per-job results are persisted as they finish so a crash mid-batch doesn't lose them
+        batch_dir = (Path.cwd() / BATCH_RESULTS_DIR / batch_id).resolve()
+        shard_dir = batch_dir / "jobs"
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        (batch_dir / "batch_header.json").write_bytes(
+            orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS)
+        )
+
+        # Resolve job IDs and descriptions up front so the LLM phase can be batched
+        prepared_jobs = []
+        for i, job in enumerate(selected_jobs):
+            # Create a clean job ID from URL or use index
+            job_url = job.get('job_url', '')
+            if job_url:
+                # Extract a clean identifier from URL
+                job_id = _JOB_ID_RE.sub('_', job_url.split('/')[-1])[:50]
+                if not job_id or job_id == '_':
                     job_id = f"job_{i}"
-                
-                future = executor.submit(self._process_single_job,
-                                       profile_data.copy(),
-                                       job,
-                                       job_id,
-                                       batch_id)
-                future_to_job[future] = (job, job_id, i)
-
-            # Collect results as they complete
-            for future in as_completed(future_to_job):
-                job, job_id, job_index = future_to_job[future]
-                results['processed_jobs'] += 1
-
-                try:
-                    job_result = future.result()
-                    results['job_results'].append(job_result)
-
-                    if job_result['status'] == 'success':
-                        results['successful_jobs'] += 1
-                    else:
-                        results['failed_jobs'] += 1
+            else:
+                job_id = f"job_{i}"
+            prepared_jobs.append((job, job_id, i, self._extract_job_description(job)))
+
+        # Jobs with unusable descriptions skip the batched prompt; _process_single_job reports the error.
+        # Jobs already analyzed for this profile are served from the cache, and postings that
+        # share a description (common in scraped data) are analyzed once and fanned back out.
+        analyses = {}
+        analyzable = []
+        duplicates = {}
+        first_by_description = {}
+        for entry in prepared_jobs:
+            if not entry[3] or len(entry[3].strip()) < 50:
+                continue
+            normalized = ' '.join(entry[3].split())
+            first = first_by_description.get(normalized)
+            if first is not None:
+                duplicates[first[2]].append(entry)
+                continue
+            first_by_description[normalized] = entry
+            duplicates[entry[2]] = []
+            cached = self._get_cached_analysis(profile_data, entry[3])
+            if cached is not None:
+                analyses[entry[2]] = cached
+            else:
+                analyzable.append(entry)
+        for first_index, same_description in duplicates.items():
+            if first_index in analyses:
+                for entry in same_description:
+                    analyses[entry[2]] = analyses[first_index]
+        if analyses:
+            logger.info(f"Reusing cached analyses for {len(analyses)}/{len(prepared_jobs)} jobs")
+        duplicate_count = sum(len(same_description) for same_description in duplicates.values())
+        if duplicate_count:
+            logger.info(f"Skipping LLM analysis for {duplicate_count} jobs with duplicate descriptions")
+
+        # Two-stage pipeline: each LLM chunk hands its jobs to the PDF pool as soon as it
+        # returns, so pdflatex overlaps the LLM calls still in flight
+        llm_slots = self.concurrency_limit or asyncio.Semaphore(self.max_workers)
+        # The improver may be shared, so its fail-fast settings are restored once the batch ends
+        saved_fail_fast = (self.resume_improver.max_connection_failures,
+                           self.resume_improver.consecutive_connection_failures)
+        if self.fail_fast:
+            self.resume_improver.max_connection_failures = FAIL_FAST_THRESHOLD
+            self.resume_improver.consecutive_connection_failures = 0
+        loop = asyncio.get_running_loop()
+        pdf_pool = ThreadPoolExecutor(max_workers=self.pdf_workers)
+
+        last_progress_at = 0.0
+
+        def record(job, job_id, job_index, job_result=None, error=None):
+            results['processed_jobs'] += 1
+            if error is None:
+                results['job_results'].append(job_result)
+
+                if job_result['status'] == 'success':
+                    results['successful_jobs'] += 1
+                else:
+                    results['failed_jobs'] += 1
 
-                    logger.info(f"Completed job {job_index + 1}/{len(selected_jobs)}: {job_id}")
+                logger.info(f"Completed job {job_index + 1}/{len(selected_jobs)}: {job_id}")
+            else:
+                logger.error(f"Failed to process job {job_id}: {error}")
+                results['failed_jobs'] += 1
+                results['job_results'].append({
+                    'job_id': job_id,
+                    'status': 'error',
+                    'error': str(error),
+                    'job_title': job.get('title', 'Unknown'),
+                    'company': job.get('company', 'Unknown')
+                })
 
+            try:
+                (shard_dir / f"{job_index:04d}_{job_id}.json").write_bytes(
+                    orjson.dumps(results['job_results'][-1], option=orjson.OPT_NON_STR_KEYS)
+                )
+            except Exception as e:
+                logger.error(f"Failed to save partial result for job {job_id}: {e}")
+
+            # Update progress if callback provided, at most every PROGRESS_INTERVAL_SECONDS
+            # plus the final update, with a compact snapshot rather than the growing results
+            nonlocal last_progress_at
+            finished = results['processed_jobs'] == results['total_jobs']
+            now = time.monotonic()
+            if progress_callback and (finished or now - last_progress_at >= PROGRESS_INTERVAL_SECONDS):
+                last_progress_at = now
+                progress = (results['processed_jobs'] / results['total_jobs']) * 100
+                progress_callback(progress, {
+                    'batch_id': batch_id,
+                    'processed_jobs': results['processed_jobs'],
+                    'total_jobs': results['total_jobs'],
+                    'successful_jobs': results['successful_jobs'],
+                    'failed_jobs': results['failed_jobs']
+                })
+
+        async def pdf_stage(entry):
+            # Every job shares the one profile dict; _process_single_job never mutates it.
+            # The analysis is popped so its suggestions can be freed once this job finishes
+            # rather than living until the end of the batch.
+            job, job_id, i, _ = entry
+            try:
+                job_result = await loop.run_in_executor(
+                    pdf_pool, self._process_single_job, profile_data, job, job_id, i, batch_dir, analyses.pop(i, None)
+                )
+            except Exception as e:
+                record(job, job_id, i, error=e)
+            else:
+                record(job, job_id, i, job_result)
+
+        async def llm_stage(chunk):
+            # One prompt per chunk of jobs instead of one per job
+            async with llm_slots:
+                if self.resume_improver.provider_unavailable:
+                    for entry in chunk:
+                        for job, job_id, i, _ in [entry] + duplicates[entry[2]]:
+                            record(job, job_id, i, {
+                                'job_id': job_id,
+                                'status': 'cancelled',
+                                'error': 'AI provider unavailable',
+                                'job_title': job.get('title', 'Unknown'),
+                                'company': job.get('company', 'Unknown'),
+                                'job_url': job.get('job_url', '')
+                            })
+                    return
+                try:
+                    chunk_analyses = await self.resume_improver.analyze_and_improve_batch_async(
+                        profile_data, [entry[3] for entry in chunk]
+                    )
+                    for entry, analysis in zip(chunk, chunk_analyses):
+                        analyses[entry[2]] = analysis
+                        for duplicate in duplicates[entry[2]]:
+                            analyses[duplicate[2]] = analysis
+                        self._store_analysis(profile_data, entry[3], analysis)
                 except Exception as e:
-                    logger.error(f"Failed to process job {job_id}: {e}")
-                    results['failed_jobs'] += 1
-                    results['job_results'].append({
-                        'job_id': job_id,
-                        'status': 'error',
-                        'error': str(e),
-                        'job_title': job.get('title', 'Unknown'),
-                        'company': job.get('company', 'Unknown')
-                    })
-
-                # Update progress if callback provided
-                if progress_callback:
-                    progress = (results['processed_jobs'] / results['total_jobs']) * 100
-                    progress_callback(progress, results)
+                    # Leave the chunk unanalyzed so each job retries on its own
+                    logger.error(f"Batched analysis failed for {len(chunk)} jobs: {e}")
+            # PDFs still differ per posting since filenames embed the company and title
+            await asyncio.gather(*(pdf_stage(job_entry)
+                                   for entry in chunk
+                                   for job_entry in [entry] + duplicates[entry[2]]))
+
+        chunks = [analyzable[start:start + ANALYSIS_BATCH_SIZE]
+                  for start in range(0, len(analyzable), ANALYSIS_BATCH_SIZE)]
+        # Cached and unanalyzable jobs need no LLM call and can start immediately
+        pending_ids = {job_entry[2] for entry in analyzable
+                       for job_entry in [entry] + duplicates[entry[2]]}
+        ready = [entry for entry in prepared_jobs if entry[2] not in pending_ids]
+
+        try:
+            await asyncio.gather(*(llm_stage(chunk) for chunk in chunks),
+                                 *(pdf_stage(entry) for entry in ready))
+        finally:
+            pdf_pool.shutdown(wait=False)
+            (self.resume_improver.max_connection_failures,
+             self.resume_improver.consecutive_connection_failures) = saved_fail_fast
+            await self.resume_improver.aclose()
 
         # Update final status
         results['status'] = 'completed' if results['failed_jobs'] == 0 else 'completed_with_errors'
@@ -126,15 +364,19 @@ class BatchResumeImprover:
     def _process_single_job(self, profile_data: Dict[str, Any],
                            job: Dict[str, Any],
                            job_id: str,
-                           batch_id: str) -> Dict[str, Any]:
+                           job_index: int,
+                           batch_dir: Path,
+                           analysis: Optional[ResumeAnalysis] = None) -> Dict[str, Any]:
         """
         Process a single job for resume improvement
 
         Args:
-            profile_data: User's profile data
+            profile_data: User's profile data, shared across the batch and treated as read-only
             job: Job dictionary
-            job_id: Unique job identifier
-            batch_id: Batch processing identifier
+            job_id: Job identifier derived from the posting URL (not unique within a batch)
+            job_index: Position of the job in the batch, used to keep its files apart
+            batch_dir: Absolute directory of the batch, already created by process_jobs_batch_async
+            analysis: Precomputed analysis from the batched LLM phase, if any
 
         Returns:
             Dictionary containing job processing result
@@ -146,16 +388,25 @@ class BatchResumeImprover:
             if not job_description or len(job_description.strip()) < 50:
                 raise ValueError("Job description is too short or missing")
 
-            # Analyze and improve resume
-            logger.info(f"Starting analysis for job {job_id}")
-            analysis = self.resume_improver.analyze_and_improve(profile_data, job_description)
+            # Analyze and improve resume unless the batched phase already did
+            if analysis is None:
+                analysis = self._get_cached_analysis(profile_data, job_description)
+            if analysis is None:
+                logger.info(f"Starting analysis for job {job_id}")
+                analysis = self.resume_improver.analyze_and_improve(profile_data, job_description)
+                self._store_analysis(profile_data, job_description, analysis)
             
             if not analysis:
                 raise ValueError("Failed to analyze resume - no analysis returned")
 
             # Generate improved profile
             logger.info(f"Generating improved profile for job {job_id}")
-            improved_profile = self.resume_improver.generate_improved_profile(profile_data, analysis)
+            cache_key = self._cache_key(profile_data, job_description)
+            improved_profile = self._cache_get('improved_profile', cache_key)
+            if improved_profile is None:
+                improved_profile = self.resume_improver.generate_improved_profile(profile_data, analysis)
+                if improved_profile and not analysis.is_fallback:
+                    self._cache_set('improved_profile', cache_key, improved_profile)
             
             if not improved_profile:
                 raise ValueError("Failed to generate improved profile")
@@ -164,7 +415,7 @@ class BatchResumeImprover:
             logger.info(f"Generating PDF resume for job {job_id}")
             
             try:
-                pdf_path = self._generate_job_specific_resume(improved_profile, job, batch_id, job_id)
+                pdf_path = self._generate_job_specific_resume(improved_profile, job, batch_dir, job_id)
             except Exception as pdf_error:
                 logger.error(f"PDF generation error for job {job_id}: {pdf_error}")
                 raise ValueError(f"PDF generation failed: {pdf_error}")
@@ -173,10 +424,7 @@ class BatchResumeImprover:
             if not pdf_path:
                 raise ValueError("Failed to generate PDF resume file - no path returned")
             
-            # Brief check to ensure file system operations are complete
-            import time
-            time.sleep(0.1)  # Reduced from 0.5s to 0.1s for better performance
-            
+            # pdflatex has already exited, so a missing file is a generation failure, not a race
             # Check if file exists and has reasonable size
             if not os.path.exists(pdf_path):
                 # Try to list files in the directory to see what's actually there
@@ -199,6 +447,15 @@ class BatchResumeImprover:
             
             logger.info(f"PDF generated successfully: {pdf_path} ({file_size} bytes)")
 
+            # Keep the bulky per-job data on disk; results only carry paths and counts.
+            # Files carry the index prefix the shards use since job_id can repeat within a batch.
+            file_stem = f"{job_index:04d}_{job_id}"
+            improved_profile_path = batch_dir / f"{file_stem}.profile.json"
+            improved_profile_path.write_bytes(orjson.dumps(improved_profile, option=orjson.OPT_NON_STR_KEYS))
+            (batch_dir / f"{file_stem}.suggestions.json").write_bytes(
+                orjson.dumps([asdict(suggestion) for suggestion in analysis.suggestions])
+            )
+
             # Create result
             result = {
                 'job_id': job_id,
@@ -207,7 +464,7 @@ class BatchResumeImprover:
                 'company': job.get('company', 'Unknown'),
                 'job_url': job.get('job_url', ''),
                 'improved_resume_path': pdf_path,
-                'improved_profile': improved_profile,  # Include the improved profile data
+                'improved_profile_path': str(improved_profile_path),
                 'analysis': {
                     'overall_match_score': analysis.overall_match_score,
                     'missing_skills': analysis.missing_skills,
@@ -218,7 +475,7 @@ class BatchResumeImprover:
                     'action_items': analysis.action_items
                 },
                 'improvements_count': len(analysis.suggestions),
-                'processed_at': datetime.utcnow().isoformat()
+                'processed_at': _utc_now_iso()
             }
 
             return result
@@ -232,48 +489,78 @@ class BatchResumeImprover:
                 'job_title': job.get('title', 'Unknown'),
                 'company': job.get('company', 'Unknown'),
                 'job_url': job.get('job_url', ''),
-                'processed_at': datetime.utcnow().isoformat()
+                'processed_at': _utc_now_iso()
             }
 
-    def _extract_job_description(self, job: Dict[str, Any]) -> str:
-        """Extract job description from job dictionary"""
-        description = job.get('description', '')
+    def _cache_key(self, profile_data: Dict[str, Any], job_description: str) -> str:
+        """SHA-256 of the canonical-JSON profile plus the whitespace-normalized job description"""
+        profile_json = json.dumps(profile_data, sort_keys=True, ensure_ascii=False, default=str)
+        normalized_jd = ' '.join(job_description.split())
+        return hashlib.sha256(profile_json.encode() + b"|" + normalized_jd.encode()).hexdigest()
 
-        # If description is missing or too short, try to build from other fields
-        if not description or len(description.strip()) < 100:
-            title = job.get('title', '')
-            company = job.get('company', '')
-            requirements = job.get('requirements', '')
-            responsibilities = job.get('responsibilities', '')
+    def _cache_get(self, namespace: str, key: str) -> Optional[Any]:
+        if not self._analysis_cache:
+            return None
+        try:
+            return self._analysis_cache.get(namespace, key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed ({namespace}): {e}")
+            return None
 
-            description = f"""
-            Job Title: {title}
-            Company: {company}
-            Requirements: {requirements}
-            Responsibilities: {responsibilities}
-            Description: {description}
-            """.strip()
+    def _cache_set(self, namespace: str, key: str, value: Any):
+        if not self._analysis_cache:
+            return
+        try:
+            self._analysis_cache.set(namespace, key, value)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed ({namespace}): {e}")
 
-        return description
+    def _get_cached_analysis(self, profile_data: Dict[str, Any], job_description: str) -> Optional[ResumeAnalysis]:
+        """Rebuild a cached ResumeAnalysis, or None on a miss"""
+        data = self._cache_get('analysis', self._cache_key(profile_data, job_description))
+        if not data:
+            return None
+        try:
+            suggestions = [ImprovementSuggestion(**item) for item in data.pop('suggestions', [])]
+            return ResumeAnalysis(suggestions=suggestions, **data)
+        except TypeError as e:
+            logger.warning(f"Discarding stale cached analysis: {e}")
+            return None
+
+    def _store_analysis(self, profile_data: Dict[str, Any], job_description: str,
+                        analysis: Optional[ResumeAnalysis]):
+        # Fallback (non-AI) results aren't cached so they get replaced once the provider is back
+        if analysis and not analysis.is_fallback:
+            self._cache_set('analysis', self._cache_key(profile_data, job_description), asdict(analysis))
+
+    def _extract_job_description(self, job: Dict[str, Any]) -> str:
+        """Extract job description from job dictionary"""
+        description = job.get('description', '')
+        if description and len(description.strip()) >= 100:
+            return description
+
+        # Description is missing or too short, so build one from the other fields
+        return '\n'.join([
+            f"Job Title: {job.get('title', '')}",
+            f"Company: {job.get('company', '')}",
+            f"Requirements: {job.get('requirements', '')}",
+            f"Responsibilities: {job.get('responsibilities', '')}",
+            f"Description: {description}"
+        ]).strip()
 
     def _generate_job_specific_resume(self, improved_profile: Dict[str, Any],
                                     job: Dict[str, Any],
-                                    batch_id: str,
+                                    batch_dir: Path,
                                     job_id: str) -> str:
         """Generate a job-specific PDF resume"""
         try:
-            # Create batch directory with absolute path
-            batch_dir = Path.cwd() / "instance" / "tmp" / "job_applications" / batch_id
-            batch_dir.mkdir(parents=True, exist_ok=True)
-
             # Generate safe filename
-            import re
             company = job.get('company', 'Unknown')
             title = job.get('title', 'Unknown')
             
             # Clean company and title names for filename
-            company = re.sub(r'[^\w\s\-_]', '', company).replace(' ', '_')[:30]
-            title = re.sub(r'[^\w\s\-_]', '', title).replace(' ', '_')[:30]
+            company = _FILENAME_RE.sub('', company).replace(' ', '_')[:30]
+            title = _FILENAME_RE.sub('', title).replace(' ', '_')[:30]
             
             # Ensure we have valid names
             company = company if company else 'Company'
@@ -283,39 +570,36 @@ class BatchResumeImprover:
             output_path = batch_dir / filename
 
             # Generate PDF
-            logger.info(f"Requesting PDF generation with output path: {output_path}")
-            logger.info(f"improved_profile type: {type(improved_profile)}")
-            logger.info(f"improved_profile content (first 200 chars): {str(improved_profile)[:200]}")
+            logger.debug("Requesting PDF generation with output path: %s", output_path)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("improved_profile head: %s", str(improved_profile)[:200])
             pdf_path = self.latex_generator.generate_resume_pdf(improved_profile, str(output_path))
             
-            logger.info(f"PDF generator returned path: {pdf_path}")
+            logger.debug("PDF generator returned path: %s", pdf_path)
             
             # Verify the returned path exists
             if pdf_path and os.path.exists(pdf_path):
-                logger.info(f"PDF file exists at returned path: {pdf_path}")
                 return str(pdf_path)
             else:
                 # Check if file exists at the original output path
                 if os.path.exists(str(output_path)):
-                    logger.info(f"PDF file found at original output path: {output_path}")
+                    logger.debug("PDF file found at original output path: %s", output_path)
                     return str(output_path)
                 else:
                     # Additional debugging
-                    logger.error(f"PDF file not found at either returned path ({pdf_path}) or output path ({output_path})")
-                    logger.error(f"Returned path exists check: {os.path.exists(pdf_path) if pdf_path else 'No path returned'}")
-                    logger.error(f"Output path exists check: {os.path.exists(str(output_path))}")
-                    logger.error(f"Current working directory: {os.getcwd()}")
+                    logger.error("PDF file not found at either returned path (%s) or output path (%s)", pdf_path, output_path)
+                    logger.error("Current working directory: %s", os.getcwd())
                     
                     # Try to list the directory
                     try:
                         output_dir = os.path.dirname(str(output_path))
                         if os.path.exists(output_dir):
                             files = os.listdir(output_dir)
-                            logger.error(f"Files in output directory {output_dir}: {files}")
+                            logger.error("Files in output directory %s: %s", output_dir, files)
                         else:
-                            logger.error(f"Output directory does not exist: {output_dir}")
+                            logger.error("Output directory does not exist: %s", output_dir)
                     except Exception as e:
-                        logger.error(f"Error checking output directory: {e}")
+                        logger.error("Error checking output directory: %s", e)
                     
                     raise RuntimeError(f"PDF generation failed - file not found at expected locations")
 
@@ -326,27 +610,60 @@ class BatchResumeImprover:
     def get_batch_results(self, batch_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve batch processing results"""
         try:
-            batch_dir = Path(f"instance/tmp/job_applications/{batch_id}")
+            batch_dir = BATCH_RESULTS_DIR / batch_id
             results_file = batch_dir / "batch_results.json"
 
             if results_file.exists():
-                with open(results_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return orjson.loads(results_file.read_bytes())
+
+            return self._load_partial_results(batch_id)
 
         except Exception as e:
             logger.error(f"Failed to load batch results for {batch_id}: {e}")
 
         return None
 
+    def load_improved_profile(self, job_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Load the improved profile a batch wrote for one job result; empty if it's missing"""
+        profile_path = job_result.get('improved_profile_path')
+        if not profile_path:
+            return {}
+        try:
+            return orjson.loads(Path(profile_path).read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Failed to load improved profile {profile_path}: {e}")
+            return {}
+
+    def _load_partial_results(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Rebuild results from the per-job shards of a batch that never saved its final file"""
+        batch_dir = BATCH_RESULTS_DIR / batch_id
+        header_file = batch_dir / "batch_header.json"
+        shard_dir = batch_dir / "jobs"
+        if not header_file.exists() and not shard_dir.is_dir():
+            return None
+
+        results = orjson.loads(header_file.read_bytes()) if header_file.exists() else {'batch_id': batch_id}
+        job_results = [orjson.loads(shard.read_bytes()) for shard in sorted(shard_dir.glob("*.json"))]
+        successful = sum(1 for job_result in job_results if job_result.get('status') == 'success')
+        results.update({
+            'job_results': job_results,
+            'processed_jobs': len(job_results),
+            'successful_jobs': successful,
+            'failed_jobs': len(job_results) - successful,
+            'status': 'incomplete'
+        })
+        return results
+
     def save_batch_results(self, batch_id: str, results: Dict[str, Any]):
         """Save batch processing results to file"""
         try:
-            batch_dir = Path(f"instance/tmp/job_applications/{batch_id}")
+            batch_dir = BATCH_RESULTS_DIR / batch_id
             batch_dir.mkdir(parents=True, exist_ok=True)
 
             results_file = batch_dir / "batch_results.json"
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            results_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         except Exception as e:
             logger.error(f"Failed to save batch results for {batch_id}: {e}")
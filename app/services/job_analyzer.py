@@ -1,24 +1,57 @@
+import os
+import pickle
+import ahocorasick
+import numpy as np
 import spacy
+from spacy.attrs import LEMMA, POS, ORTH, LOWER, LENGTH, IS_STOP, IS_PUNCT, IS_SPACE, IS_DIGIT
 from spacy.matcher import PhraseMatcher
+from spacy.symbols import NOUN, ADJ, PROPN, VERB
 from skillNer.general_params import SKILL_DB
 from skillNer.skill_extractor_class import SkillExtractor
-import pandas as pd
-from collections import Counter, defaultdict, OrderedDict
+from collections import Counter, defaultdict
+from operator import attrgetter
+import heapq
 import time
 import re
 import logging
 import hashlib
 from typing import List, Dict, Any, Optional, Set, Tuple
-from dataclasses import dataclass, field
-import json
+from dataclasses import dataclass, field, replace
+import csv
+import orjson
 from datetime import datetime
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from importlib import metadata
+from pathlib import Path
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Documents per nlp.pipe() batch in analyze_batch
+JOB_SPACY_BATCH = int(os.environ.get("JOB_SPACY_BATCH", "64"))
+# Postings needed before analyze_batch parses in a spaCy process pool (startup costs ~1s)
+JOB_SPACY_PROCESS_MIN = int(os.environ.get("JOB_SPACY_PROCESS_MIN", "500"))
+
+# Fast-mode size gates: tiny postings skip spaCy, short ones get keywords without NER
+FAST_SKIP_NLP_CHARS = 300
+FAST_KEYWORDS_ONLY_CHARS = 1000
+
+# Pickled skillNER extractor, reused across restarts instead of rebuilding its PhraseMatchers
+SKILLNER_CACHE_PATH = Path(os.environ.get("SKILLNER_CACHE_PATH", "instance/tmp/skillner_extractor.pkl"))
+
+# Text cleaning in one pass: any run of whitespace or unsupported characters becomes a
+# single space, and "5+ year(s)" variants are normalized to "5+ years" along the way
+_CLEAN_JUNK = r'[^\w\-\+\#\.\(\)\[\]/:,;!?&@]'
+_CLEAN_RE = re.compile(r'\b(\d+)\+' + _CLEAN_JUNK + r'*years?\b|' + _CLEAN_JUNK + '+', re.IGNORECASE)
+
+# Token attributes pulled in one Doc.to_array() call by extract_keywords_optimized
+_KEYWORD_ATTRS = [LEMMA, POS, ORTH, LOWER, LENGTH, IS_STOP, IS_PUNCT, IS_SPACE, IS_DIGIT]
+_KEYWORD_POS_IDS = np.array([NOUN, ADJ, PROPN, VERB], dtype=np.uint64)
+_KEYWORD_SKIP_WORDS = ('year', 'years', 'experience')
+
 @dataclass
 class ExtractedSkill:
     """Data class for extracted skills with validation"""
@@ -33,6 +66,8 @@ class ExtractedSkill:
         self.confidence = max(0.0, min(1.0, float(self.confidence)))  # Clamp between 0-1
         self.name = self.name.strip()
         self.surface_form = self.surface_form.strip()
+        # Dedup preference: skillNER first, then confidence, then shorter surface form
+        self._sort_key = (self.source == 'skillNER', self.confidence, -len(self.surface_form))
 
 @dataclass
 class ExtractedEntity:
@@ -84,6 +119,7 @@ class OptimizedJobAnalyzer:
             enable_threading: Enable parallel processing for batch jobs
             max_workers: Number of worker threads for parallel processing
         """
+        self.spacy_model = spacy_model
         self.confidence_threshold = confidence_threshold
         self.max_skills_per_job = max_skills_per_job
         self.fast_mode = bool(fast_mode)
@@ -91,10 +127,20 @@ class OptimizedJobAnalyzer:
         self.enable_threading = enable_threading
         self.max_workers = max_workers
         
-        # Thread-safe cache with hash-based keys
+        # Thread-safe cache with hash-based keys (insertion-ordered dict, oldest evicted first)
         self._cache_lock = threading.RLock()
-        self._result_cache = OrderedDict()
-        self._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._result_cache: Dict[str, JobAnalysisResult] = {}
+        # Raw posting key -> cleaned text, so repeat postings skip the regex passes
+        self._clean_cache: Dict[str, str] = {}
+        # Per-thread hit/miss/eviction counters, summed on demand by _cache_stats_snapshot
+        self._cache_stats_local = threading.local()
+        self._cache_stats_by_thread: Dict[int, Dict[str, int]] = {}
+        self._cache_stats_lock = threading.Lock()
+        
+        # Worker processes for analyze_multiple_postings, created on first use and reused
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_config = None
+        self._process_pool_lock = threading.Lock()
         
         # Performance monitoring
         self._performance_stats = {
@@ -111,6 +157,7 @@ class OptimizedJobAnalyzer:
         
         # Initialize models
         self.nlp = self._init_spacy(spacy_model, fast_mode=self.fast_mode)
+        self._label_descriptions = self._build_label_descriptions()
         self.skill_extractor = None if self.fast_mode else self._init_skillner()
         
         # Precompile common regex patterns for better performance
@@ -131,19 +178,21 @@ class OptimizedJobAnalyzer:
                     nlp = spacy.load(model_name, disable=disabled_components)
                     logger.info(f"✓ Fast mode: Using {model_name} with disabled components")
             else:
-                # Normal mode: use full model but optimize pipeline
-                nlp = spacy.load(model_name)
+                # Normal mode: use full model but optimize pipeline. The dependency parser
+                # feeds nothing downstream (entities need ner, keywords need tagger,
+                # attribute_ruler and lemmatizer), so skip it
+                nlp = spacy.load(model_name, disable=['parser'])
                 # Add custom extensions if needed
                 if not spacy.tokens.Token.has_extension("is_tech_term"):
                     spacy.tokens.Token.set_extension("is_tech_term", default=False)
-                logger.info(f"✓ Full mode: Using {model_name} with all components")
+                logger.info(f"✓ Full mode: Using {model_name} without the parser")
             
             return nlp
         except OSError as e:
             logger.error(f"Failed to load spaCy model {model_name}: {e}")
             # Emergency fallback
             try:
-                nlp = spacy.load('en_core_web_sm')
+                nlp = spacy.load('en_core_web_sm', disable=['parser'])
                 logger.warning("Emergency fallback to en_core_web_sm")
                 return nlp
             except OSError:
@@ -152,8 +201,19 @@ class OptimizedJobAnalyzer:
                     "python -m spacy download en_core_web_sm"
                 )
 
+    def _build_label_descriptions(self) -> Dict[str, str]:
+        """Resolve spacy.explain() once for every label the NER component can emit"""
+        if 'ner' not in self.nlp.pipe_names:
+            return {}
+        return {label: spacy.explain(label) or label for label in self.nlp.get_pipe('ner').labels}
+
     def _init_skillner(self):
         """Initialize skillNER with error handling and retries"""
+        skill_extractor = self._load_cached_skillner()
+        if skill_extractor is not None:
+            logger.info("✓ skillNER loaded from cache")
+            return skill_extractor
+        
         max_retries = 3
         for attempt in range(max_retries):
             try:
@@ -163,6 +223,7 @@ class OptimizedJobAnalyzer:
                     phraseMatcher=PhraseMatcher
                 )
                 logger.info("✓ skillNER initialized successfully")
+                self._save_cached_skillner(skill_extractor)
                 return skill_extractor
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -172,6 +233,66 @@ class OptimizedJobAnalyzer:
                     logger.error(f"skillNER initialization failed after {max_retries} attempts: {e}")
                     return None
 
+    def _skillner_cache_stamp(self) -> Tuple:
+        """Identify the pipeline and skill DB a pickled extractor was built against"""
+        try:
+            skillner_version = metadata.version('skillNer')
+        except metadata.PackageNotFoundError:
+            skillner_version = None
+        meta = self.nlp.meta
+        return (spacy.__version__, skillner_version, meta.get('lang'), meta.get('name'),
+                meta.get('version'), tuple(self.nlp.pipe_names), len(SKILL_DB))
+
+    def _load_cached_skillner(self):
+        """Load a pickled SkillExtractor bound to this analyzer's nlp, or None if missing/stale"""
+        nlp = self.nlp
+        
+        class _Unpickler(pickle.Unpickler):
+            def persistent_load(self, pid):
+                # The live pipeline is substituted for the references written by _save_cached_skillner
+                if pid == 'nlp':
+                    return nlp
+                if pid == 'vocab':
+                    return nlp.vocab
+                raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+        
+        try:
+            with open(SKILLNER_CACHE_PATH, 'rb') as f:
+                unpickler = _Unpickler(f)
+                if unpickler.load() != self._skillner_cache_stamp():
+                    return None
+                return unpickler.load()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable skillNER cache: {e}")
+            return None
+
+    def _save_cached_skillner(self, skill_extractor):
+        """Pickle the extractor, storing the nlp pipeline and vocab by reference only"""
+        nlp = self.nlp
+        
+        class _Pickler(pickle.Pickler):
+            def persistent_id(self, obj):
+                if obj is nlp:
+                    return 'nlp'
+                if obj is nlp.vocab:
+                    return 'vocab'
+                return None
+        
+        # Per-process temp file: pool workers may all build the extractor on a cold start
+        tmp_path = SKILLNER_CACHE_PATH.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            SKILLNER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickler = _Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickler.dump(self._skillner_cache_stamp())
+                pickler.dump(skill_extractor)
+            os.replace(tmp_path, SKILLNER_CACHE_PATH)
+        except Exception as e:
+            logger.warning(f"Could not cache skillNER extractor: {e}")
+            tmp_path.unlink(missing_ok=True)
+
     def _load_skill_mapping(self) -> Dict[str, str]:
         """Load and cache skill ID mappings with error handling"""
         mapping = {}
@@ -234,60 +355,82 @@ class OptimizedJobAnalyzer:
                 'slack', 'teams', 'figma', 'sketch', 'adobe xd', 'photoshop'
             ]
         }
+        
+        # One automaton over every (category, skill) pair so the fallback scans the text once
+        self._skill_automaton = ahocorasick.Automaton()
+        for category, skills in self.tech_skills_patterns.items():
+            for skill in skills:
+                key = skill.lower()
+                _, categories = self._skill_automaton.get(key, (key, []))
+                categories.append(category)
+                self._skill_automaton.add_word(key, (key, categories))
+        self._skill_automaton.make_automaton()
+        
+        # Flat lookup for the is_technical check in keyword extraction
+        self._all_tech_skills_lower = frozenset(
+            skill.lower() for skills in self.tech_skills_patterns.values() for skill in skills
+        )
 
     def _precompile_patterns(self):
-        """Precompile regex patterns for performance"""
-        self._compiled_patterns = {}
-        # Always compile patterns; in fast_mode we use simpler, faster patterns
-        for category, skills in self.tech_skills_patterns.items():
-            try:
-                if self.fast_mode:
-                    # Simple OR pattern with word boundaries (faster to compile and execute)
-                    simple = r'\b(?:' + '|'.join(re.escape(s) for s in skills) + r')\b'
-                    self._compiled_patterns[category] = re.compile(simple, re.IGNORECASE)
-                else:
-                    # More precise patterns to reduce false positives
-                    patterns = []
-                    for skill in skills:
-                        escaped = re.escape(skill)
-                        if ' ' in skill:
-                            pattern = escaped.replace(r'\ ', r'\s+')
-                        else:
-                            pattern = escaped
-                        patterns.append(pattern)
-                    combined = r'\b(?:' + '|'.join(patterns) + r')\b'
-                    self._compiled_patterns[category] = re.compile(combined, re.IGNORECASE)
-            except re.error as e:
-                logger.warning(f"Failed to compile regex for {category}: {e}")
-                continue
+        """Precompile one combined skill regex for text the automaton can't scan"""
+        # A single alternation over every curated skill, longest first so multi-word skills
+        # win at a shared start; the category comes from the automaton's entry for the match
+        skills = sorted({skill for skills in self.tech_skills_patterns.values() for skill in skills},
+                        key=len, reverse=True)
+        alternatives = []
+        for skill in skills:
+            escaped = re.escape(skill)
+            if not self.fast_mode and ' ' in skill:
+                # More precise patterns allow any whitespace between words
+                escaped = escaped.replace(r'\ ', r'\s+')
+            alternatives.append(escaped)
+        self._skill_regex = re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b', re.IGNORECASE)
 
     def _get_cache_key(self, text: str) -> str:
         """Generate efficient cache key using hash"""
-        # Use first 100 chars + hash of full text for balance of uniqueness and speed
-        prefix = text[:100]
-        hash_suffix = hashlib.md5(text.encode()).hexdigest()[:8]
-        return f"{len(text)}_{prefix}_{hash_suffix}"
+        # Short postings key on the text itself; longer ones on a 64-bit blake2b digest
+        if len(text) < 512:
+            return text
+        return f"{len(text)}_{hashlib.blake2b(text.encode(), digest_size=8).hexdigest()}"
 
     def _cache_get(self, key: str) -> Optional[JobAnalysisResult]:
-        """Thread-safe cache retrieval"""
-        with self._cache_lock:
-            if key in self._result_cache:
-                # Move to end (mark as recently used)
-                result = self._result_cache.pop(key)
-                self._result_cache[key] = result
-                self._cache_stats['hits'] += 1
-                return result
-            else:
-                self._cache_stats['misses'] += 1
-                return None
+        """Lock-free cache retrieval (dict.get is atomic; only writers take the lock)"""
+        result = self._result_cache.get(key)
+        stats = self._thread_cache_stats()
+        if result is not None:
+            stats['hits'] += 1
+        else:
+            stats['misses'] += 1
+        return result
+
+    def _thread_cache_stats(self) -> Dict[str, int]:
+        """This thread's cache counters; only the owning thread writes them, so no lock per hit"""
+        stats = getattr(self._cache_stats_local, 'stats', None)
+        if stats is None:
+            with self._cache_stats_lock:
+                # Thread idents are reused after a thread exits, so a new thread picks up its
+                # predecessor's counters and the registry stays bounded
+                stats = self._cache_stats_by_thread.setdefault(
+                    threading.get_ident(), {'hits': 0, 'misses': 0, 'evictions': 0})
+            self._cache_stats_local.stats = stats
+        return stats
+
+    def _cache_stats_snapshot(self) -> Dict[str, int]:
+        """Cache counters summed across threads"""
+        totals = {'hits': 0, 'misses': 0, 'evictions': 0}
+        with self._cache_stats_lock:
+            for stats in self._cache_stats_by_thread.values():
+                for name, value in stats.items():
+                    totals[name] += value
+        return totals
 
     def _cache_put(self, key: str, result: JobAnalysisResult):
-        """Thread-safe cache storage with LRU eviction"""
+        """Thread-safe cache storage with oldest-first eviction"""
         with self._cache_lock:
-            # Remove oldest entries if cache is full
+            # Remove oldest entries if cache is full (dicts keep insertion order)
             while len(self._result_cache) >= self.cache_size:
-                self._result_cache.popitem(last=False)
-                self._cache_stats['evictions'] += 1
+                del self._result_cache[next(iter(self._result_cache))]
+                self._thread_cache_stats()['evictions'] += 1
             
             self._result_cache[key] = result
 
@@ -301,21 +444,25 @@ class OptimizedJobAnalyzer:
             logger.warning("Text too short for meaningful analysis")
             return text
         
-        # More sophisticated cleaning
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove or replace problematic characters while preserving structure
-        text = re.sub(r'[^\w\s\-\+\#\.\(\)\[\]/:,;!?&@]', ' ', text)
-        
-        # Handle common abbreviations and formats
-        text = re.sub(r'\b(\d+)\+\s*years?\b', r'\1+ years', text, flags=re.IGNORECASE)
-        text = re.sub(r'\b(\w+)\.js\b', r'\1.js', text, flags=re.IGNORECASE)
-        
-        # Final cleanup
-        text = re.sub(r'\s{2,}', ' ', text).strip()
-        
-        return text
+        raw_key = self._get_cache_key(text)
+        cleaned = self._clean_cache.get(raw_key)
+        if cleaned is not None:
+            return cleaned
+        cleaned = self._clean_text(text)
+        with self._cache_lock:
+            while len(self._clean_cache) >= self.cache_size:
+                del self._clean_cache[next(iter(self._clean_cache))]
+            self._clean_cache[raw_key] = cleaned
+        return cleaned
+
+    def _clean_text(self, text: str) -> str:
+        """Normalize whitespace and strip problematic characters"""
+        return _CLEAN_RE.sub(self._clean_replacement, text).strip()
+
+    @staticmethod
+    def _clean_replacement(match: re.Match) -> str:
+        years = match.group(1)
+        return f"{years}+ years" if years else ' '
 
     def extract_skills_skillner(self, text: str) -> Tuple[List[ExtractedSkill], float]:
         """Enhanced skillNER extraction with timing"""
@@ -407,40 +554,61 @@ class OptimizedJobAnalyzer:
             logger.error(f"skillNER extraction failed: {e}")
             return [], processing_time
 
+    def _match_skills(self, text: str) -> List[Tuple[str, str, str]]:
+        """
+        Find (matched text, lowercase skill key, category) triples for curated skills in text
+        
+        The text is lowercased once here and the key handed back, so callers never re-fold
+        matches. The automaton path yields only the first occurrence of each skill under its
+        first category, which is all extract_skills_fallback keeps; the regex path may repeat.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed offsets (rare non-ASCII input); use the combined regex
+            matches = []
+            for match in self._skill_regex.finditer(text):
+                key = ' '.join(match.group(0).lower().split())
+                entry = self._skill_automaton.get(key, None)
+                if entry is not None:
+                    matches.append((match.group(0), key, entry[1][0]))
+            return matches
+        
+        matches = []
+        seen = set()
+        for end, (key, categories) in self._skill_automaton.iter(lowered):
+            if key in seen:
+                continue
+            start = end - len(key) + 1
+            # Whole-word check on the neighbouring characters
+            if start > 0 and (lowered[start - 1].isalnum() or lowered[start - 1] == '_'):
+                continue
+            if end + 1 < len(lowered) and (lowered[end + 1].isalnum() or lowered[end + 1] == '_'):
+                continue
+            seen.add(key)
+            matches.append((text[start:end + 1], key, categories[0]))
+        return matches
+
     def extract_skills_fallback(self, text: str) -> Tuple[List[ExtractedSkill], float]:
         """Optimized fallback skill extraction"""
         start_time = time.time()
-        skills_found = []
         
         try:
-            # Use precompiled patterns for better performance
-            for category, pattern in self._compiled_patterns.items():
-                matches = pattern.finditer(text)
-                for match in matches:
-                    matched_text = match.group(0)
-                    # Normalize the matched text
-                    normalized = matched_text.lower().strip()
-                    
-                    # Skip very short matches or numbers
-                    if len(normalized) < 2 or normalized.isdigit():
-                        continue
-                    
-                    skills_found.append(ExtractedSkill(
-                        name=matched_text.title(),
-                        surface_form=matched_text,
-                        confidence=0.85,
-                        skill_type=category,
-                        source='fallback'
-                    ))
-            
-            # Remove duplicates more efficiently
+            # Deduplicate on the normalized text before building any ExtractedSkill
             seen_skills = set()
             unique_skills = []
-            for skill in skills_found:
-                key = skill.name.lower().strip()
-                if key not in seen_skills:
-                    seen_skills.add(key)
-                    unique_skills.append(skill)
+            for matched_text, normalized, category in self._match_skills(text):
+                # Skip very short matches, numbers and repeats
+                if len(normalized) < 2 or normalized.isdigit() or normalized in seen_skills:
+                    continue
+                seen_skills.add(normalized)
+                
+                unique_skills.append(ExtractedSkill(
+                    name=matched_text.title(),
+                    surface_form=matched_text,
+                    confidence=0.85,
+                    skill_type=category,
+                    source='fallback'
+                ))
             
             processing_time = time.time() - start_time
             logger.debug(f"Fallback extracted {len(unique_skills)} skills in {processing_time:.3f}s")
@@ -451,12 +619,13 @@ class OptimizedJobAnalyzer:
             logger.error(f"Fallback extraction failed: {e}")
             return [], processing_time
 
-    def extract_entities_fast(self, text: str) -> Tuple[List[ExtractedEntity], float]:
-        """Fast entity extraction with caching and filtering"""
+    def extract_entities_fast(self, text: str, doc=None) -> Tuple[List[ExtractedEntity], float]:
+        """Fast entity extraction with caching and filtering; pass doc to reuse an existing parse"""
         start_time = time.time()
         
         try:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             entities = []
             
             # Predefined sets for faster lookup
@@ -467,11 +636,9 @@ class OptimizedJobAnalyzer:
             }
             
             for ent in doc.ents:
-                ent_lower = ent.text.lower().strip()
-                
-                # Skip misclassified tech terms
-                if (ent_lower in tech_terms_lower and 
-                    ent.label_ in {'PERSON', 'LOC', 'GPE'}):
+                # Skip misclassified tech terms (only these labels need the lowercased text)
+                if (ent.label_ in {'PERSON', 'LOC', 'GPE'} and
+                    ent.text.lower().strip() in tech_terms_lower):
                     continue
                 
                 # Skip very short entities unless they're organizations
@@ -483,7 +650,7 @@ class OptimizedJobAnalyzer:
                     entities.append(ExtractedEntity(
                         text=ent.text,
                         label=ent.label_,
-                        description=spacy.explain(ent.label_) or ent.label_,
+                        description=self._label_descriptions.get(ent.label_, ent.label_),
                         confidence=1.0,
                         start=ent.start_char,
                         end=ent.end_char
@@ -497,71 +664,76 @@ class OptimizedJobAnalyzer:
             logger.error(f"Entity extraction failed: {e}")
             return [], processing_time
 
-    def extract_keywords_optimized(self, text: str) -> Tuple[List[Dict[str, Any]], float]:
-        """Optimized keyword extraction with better scoring"""
+    def extract_keywords_optimized(self, text: str, doc=None) -> Tuple[List[Dict[str, Any]], float]:
+        """Optimized keyword extraction with better scoring; pass doc to reuse an existing parse"""
         start_time = time.time()
         
         try:
-            doc = self.nlp(text)
-            keyword_freq = defaultdict(int)
+            if doc is None:
+                doc = self.nlp(text)
+            keyword_freq = Counter()
             keyword_info = {}
+            strings = doc.vocab.strings
             
-            # Process tokens efficiently
-            for token in doc:
-                if (token.is_stop or token.is_punct or token.is_space or 
-                    len(token.text) < 3 or token.text.isdigit() or 
-                    token.text.lower() in {'year', 'years', 'experience'}):
-                    continue
+            # Filter tokens in bulk on the attribute matrix instead of per-token Python access
+            arr = doc.to_array(_KEYWORD_ATTRS)
+            skip_ids = np.array([strings.add(w) for w in _KEYWORD_SKIP_WORDS], dtype=np.uint64)
+            keep = (
+                (arr[:, 5] == 0) & (arr[:, 6] == 0) & (arr[:, 7] == 0) & (arr[:, 8] == 0) &
+                (arr[:, 4] >= 3) & ~np.isin(arr[:, 3], skip_ids) &
+                np.isin(arr[:, 1], _KEYWORD_POS_IDS)
+            )
+            rows = arr[keep]
+            
+            if len(rows):
+                lemma_ids, first_idx, counts = np.unique(rows[:, 0], return_index=True, return_counts=True)
                 
-                # Focus on meaningful POS tags
-                if token.pos_ in ['NOUN', 'ADJ', 'PROPN', 'VERB']:
-                    lemma = token.lemma_.lower()
-                    keyword_freq[lemma] += 1
+                original_forms = defaultdict(set)
+                for lemma_id, orth_id in np.unique(rows[:, [0, 2]], axis=0).tolist():
+                    original_forms[lemma_id].add(strings[orth_id])
+                
+                # Walk lemmas in first-occurrence order; only unique lemmas touch the StringStore
+                for j in np.argsort(first_idx, kind='stable').tolist():
+                    lemma_id = int(lemma_ids[j])
+                    lemma = strings[lemma_id].lower()
+                    keyword_freq[lemma] += int(counts[j])
                     
                     if lemma not in keyword_info:
                         keyword_info[lemma] = {
                             'text': lemma,
-                            'pos': token.pos_,
+                            'pos': strings[int(rows[first_idx[j], 1])],
                             'original_forms': set(),
-                            'is_technical': False
+                            # Mark as technical if it appears in our patterns
+                            'is_technical': lemma in self._all_tech_skills_lower
                         }
                     
-                    keyword_info[lemma]['original_forms'].add(token.text)
-                    
-                    # Mark as technical if it appears in our patterns
-                    if not keyword_info[lemma]['is_technical']:
-                        for skills in self.tech_skills_patterns.values():
-                            if lemma in [s.lower() for s in skills]:
-                                keyword_info[lemma]['is_technical'] = True
-                                break
+                    keyword_info[lemma]['original_forms'].update(original_forms[lemma_id])
             
-            # Build keyword list with enhanced scoring
+            # Build keyword list with enhanced scoring (every counted lemma has freq >= 1)
             keywords = []
             for lemma, freq in keyword_freq.items():
-                if freq >= 1:
-                    info = keyword_info[lemma]
-                    
-                    # Enhanced importance scoring
-                    base_score = freq
-                    if info['pos'] in ['NOUN', 'PROPN']:
-                        base_score *= 1.5
-                    if info['is_technical']:
-                        base_score *= 2.0
-                    if freq > 2:  # Bonus for frequently mentioned terms
-                        base_score *= 1.2
-                    
-                    keywords.append({
-                        'text': lemma,
-                        'pos': info['pos'],
-                        'frequency': freq,
-                        'original_forms': list(info['original_forms']),
-                        'importance_score': round(base_score, 2),
-                        'is_technical': info['is_technical']
-                    })
-            
-            # Sort by importance and limit results
-            keywords.sort(key=lambda x: x['importance_score'], reverse=True)
-            keywords = keywords[:50]
+                info = keyword_info[lemma]
+                
+                # Enhanced importance scoring
+                base_score = freq
+                if info['pos'] in ('NOUN', 'PROPN'):
+                    base_score *= 1.5
+                if info['is_technical']:
+                    base_score *= 2.0
+                if freq > 2:  # Bonus for frequently mentioned terms
+                    base_score *= 1.2
+                
+                keywords.append({
+                    'text': lemma,
+                    'pos': info['pos'],
+                    'frequency': freq,
+                    'original_forms': list(info['original_forms']),
+                    'importance_score': round(base_score, 2),
+                    'is_technical': info['is_technical']
+                })
+            
+            # Keep the 50 most important (same order as a stable descending sort)
+            keywords = heapq.nlargest(50, keywords, key=lambda x: x['importance_score'])
             
             processing_time = time.time() - start_time
             return keywords, processing_time
@@ -571,8 +743,12 @@ class OptimizedJobAnalyzer:
             logger.error(f"Keyword extraction failed: {e}")
             return [], processing_time
 
-    def analyze_job_posting(self, text: str, job_id: str = None) -> JobAnalysisResult:
-        """Main analysis method with comprehensive error handling and performance monitoring"""
+    def analyze_job_posting(self, text: str, job_id: str = None, doc=None) -> JobAnalysisResult:
+        """
+        Main analysis method with comprehensive error handling and performance monitoring
+        
+        Pass doc (a spaCy Doc of the cleaned text, e.g. from nlp.pipe) to skip re-parsing.
+        """
         start_time = time.time()
         
         try:
@@ -587,97 +763,189 @@ class OptimizedJobAnalyzer:
             cache_key = self._get_cache_key(clean_text)
             cached_result = self._cache_get(cache_key)
             if cached_result:
-                cached_result.cache_hit = True
-                cached_result.job_id = job_id  # Update job ID
-                return cached_result
-            
-            # Extract skills using available methods
-            skillner_skills, skillner_time = [], 0.0
-            fallback_skills, fallback_time = [], 0.0
-            
-            if not self.fast_mode and self.skill_extractor:
-                skillner_skills, skillner_time = self.extract_skills_skillner(clean_text)
-            
-            fallback_skills, fallback_time = self.extract_skills_fallback(clean_text)
-            
-            # Combine and deduplicate skills
-            all_skills = skillner_skills + fallback_skills
-            unique_skills = self._deduplicate_skills_advanced(all_skills)
-            
-            # Extract other information (skip in ultra-fast mode)
-            entities, entity_time = [], 0.0
-            keywords, keyword_time = [], 0.0
-            
-            if not self.fast_mode or len(unique_skills) < 5:  # Extract more info if few skills found
-                entities, entity_time = self.extract_entities_fast(clean_text)
-                keywords, keyword_time = self.extract_keywords_optimized(clean_text)
-            
-            # Calculate processing time
-            total_time = time.time() - start_time
-            
-            # Build comprehensive metadata
-            metadata = {
-                'original_length': len(text),
-                'cleaned_length': len(clean_text),
-                'word_count': len(clean_text.split()),
-                'skillner_skills_count': len(skillner_skills),
-                'fallback_skills_count': len(fallback_skills),
-                'total_unique_skills': len(unique_skills),
-                'entities_count': len(entities),
-                'keywords_count': len(keywords),
-                'processing_times': {
-                    'total': round(total_time, 4),
-                    'skillner': round(skillner_time, 4),
-                    'fallback': round(fallback_time, 4),
-                    'entities': round(entity_time, 4),
-                    'keywords': round(keyword_time, 4)
-                },
-                'fast_mode': self.fast_mode,
-                'confidence_threshold': self.confidence_threshold,
-                'processing_timestamp': datetime.now().isoformat()
-            }
+                # A copy, so the cached entry (shared with other callers) keeps its own job ID
+                return replace(cached_result, cache_hit=True, job_id=job_id)
             
-            # Create result
-            result = JobAnalysisResult(
-                job_id=job_id,
-                skills=unique_skills,
-                entities=entities,
-                keywords=keywords,
-                requirements_sections=[],
-                metadata=metadata,
-                processing_time=total_time,
-                cache_hit=False
-            )
+            skills = self._extract_all_skills(clean_text)
+            return self._build_result(text, clean_text, job_id, cache_key, start_time, skills, doc)
             
-            # Cache the result
+        except Exception as e:
+            return self._error_result(job_id, e, start_time)
+
+    def analyze_batch(self, texts: List[str], job_ids: List[str] = None) -> List[JobAnalysisResult]:
+        """
+        Analyze many postings, running spaCy over all uncached texts in one nlp.pipe() pass
+        
+        Results are returned in input order; each posting is tokenized at most once.
+        """
+        if job_ids is None:
+            job_ids = [f"job_{i+1:03d}" for i in range(len(texts))]
+        if len(job_ids) != len(texts):
+            raise ValueError("Number of job_ids must match number of texts")
+        
+        results: List[Optional[JobAnalysisResult]] = [None] * len(texts)
+        pending = []
+        # Repeated postings within the batch are analyzed once (skillNER included) and copied
+        first_by_key: Dict[str, int] = {}
+        duplicates = []
+        for i, (text, job_id) in enumerate(zip(texts, job_ids)):
+            start_time = time.time()
             try:
-                self._cache_put(cache_key, result)
+                clean_text = self.clean_and_validate_text(text)
+                cache_key = self._get_cache_key(clean_text)
+                cached_result = self._cache_get(cache_key)
+                if cached_result:
+                    results[i] = replace(cached_result, cache_hit=True, job_id=job_id)
+                    continue
+                if cache_key in first_by_key:
+                    duplicates.append((i, job_id, first_by_key[cache_key]))
+                    continue
+                first_by_key[cache_key] = i
+                skills = self._extract_all_skills(clean_text)
+                pending.append((i, text, clean_text, job_id, cache_key, start_time, skills))
             except Exception as e:
-                logger.warning(f"Failed to cache result: {e}")
-            
-            # Update performance stats
-            self._update_performance_stats(total_time, skillner_time, entity_time + keyword_time, fallback_time)
-            
-            return result
-            
+                results[i] = self._error_result(job_id, e, start_time)
+        
+        # Only postings that go on to entity/keyword extraction need a parsed Doc
+        needs_doc = [entry for entry in pending if self._needs_nlp(entry[6][4], entry[2])]
+        docs = {}
+        if needs_doc:
+            # Large batches parse across processes; spaCy holds the GIL for most of a pass
+            n_process = 1
+            if self.enable_threading and len(needs_doc) >= JOB_SPACY_PROCESS_MIN:
+                n_process = max(1, self.max_workers or 1)
+            try:
+                parsed = self.nlp.pipe((entry[2] for entry in needs_doc), batch_size=JOB_SPACY_BATCH,
+                                       n_process=n_process)
+                docs = {entry[0]: doc for entry, doc in zip(needs_doc, parsed)}
+            except Exception as e:
+                # Fall back to per-posting parsing inside the extractors
+                logger.warning(f"Batched spaCy parsing failed: {e}")
+        
+        for i, text, clean_text, job_id, cache_key, start_time, skills in pending:
+            try:
+                results[i] = self._build_result(text, clean_text, job_id, cache_key, start_time,
+                                                skills, docs.get(i))
+            except Exception as e:
+                results[i] = self._error_result(job_id, e, start_time)
+        
+        for i, job_id, first in duplicates:
+            results[i] = replace(results[first], job_id=job_id, cache_hit=True)
+        
+        return results
+
+    def _extract_all_skills(self, clean_text: str) -> Tuple[List[ExtractedSkill], float, List[ExtractedSkill], float, List[ExtractedSkill]]:
+        """Run skillNER (when enabled) and the pattern fallback, returning raw and deduplicated skills"""
+        skillner_skills, skillner_time = [], 0.0
+        
+        if not self.fast_mode and self.skill_extractor:
+            skillner_skills, skillner_time = self.extract_skills_skillner(clean_text)
+        
+        fallback_skills, fallback_time = self.extract_skills_fallback(clean_text)
+        
+        # Combine and deduplicate skills
+        unique_skills = self._deduplicate_skills_advanced(skillner_skills + fallback_skills)
+        return skillner_skills, skillner_time, fallback_skills, fallback_time, unique_skills
+
+    def _needs_nlp(self, unique_skills: List[ExtractedSkill], clean_text: str) -> bool:
+        # Skip entities/keywords in fast mode unless few skills were found; tiny postings
+        # never pay the fixed spaCy per-call cost in fast mode
+        if not self.fast_mode:
+            return True
+        return len(unique_skills) < 5 and len(clean_text) >= FAST_SKIP_NLP_CHARS
+
+    def _keywords_only(self, clean_text: str) -> bool:
+        # Short fast-mode postings skip NER and only extract keywords
+        return self.fast_mode and len(clean_text) < FAST_KEYWORDS_ONLY_CHARS
+
+    def _build_result(self, text: str, clean_text: str, job_id: str, cache_key: str, start_time: float,
+                      skills: Tuple, doc=None) -> JobAnalysisResult:
+        """Finish an uncached analysis: entities, keywords, metadata, caching and stats"""
+        skillner_skills, skillner_time, fallback_skills, fallback_time, unique_skills = skills
+        
+        # Extract other information (skip in ultra-fast mode)
+        entities, entity_time = [], 0.0
+        keywords, keyword_time = [], 0.0
+        parse_time = 0.0
+        
+        if self._needs_nlp(unique_skills, clean_text):
+            keywords_only = self._keywords_only(clean_text)
+            # Parse once and share the Doc between entity and keyword extraction
+            if doc is None:
+                parse_start = time.time()
+                doc = self.nlp(clean_text, disable=['ner'] if keywords_only else [])
+                parse_time = time.time() - parse_start
+            if not keywords_only:
+                entities, entity_time = self.extract_entities_fast(clean_text, doc=doc)
+            keywords, keyword_time = self.extract_keywords_optimized(clean_text, doc=doc)
+        
+        # Calculate processing time
+        total_time = time.time() - start_time
+        
+        # Build comprehensive metadata
+        metadata = {
+            'original_length': len(text),
+            'cleaned_length': len(clean_text),
+            'word_count': len(clean_text.split()),
+            'skillner_skills_count': len(skillner_skills),
+            'fallback_skills_count': len(fallback_skills),
+            'total_unique_skills': len(unique_skills),
+            'entities_count': len(entities),
+            'keywords_count': len(keywords),
+            'processing_times': {
+                'total': round(total_time, 4),
+                'skillner': round(skillner_time, 4),
+                'fallback': round(fallback_time, 4),
+                'parse': round(parse_time, 4),
+                'entities': round(entity_time, 4),
+                'keywords': round(keyword_time, 4)
+            },
+            'fast_mode': self.fast_mode,
+            'confidence_threshold': self.confidence_threshold,
+            'processing_timestamp': datetime.now().isoformat()
+        }
+        
+        # Create result
+        result = JobAnalysisResult(
+            job_id=job_id,
+            skills=unique_skills,
+            entities=entities,
+            keywords=keywords,
+            requirements_sections=[],
+            metadata=metadata,
+            processing_time=total_time,
+            cache_hit=False
+        )
+        
+        # Cache the result
+        try:
+            self._cache_put(cache_key, result)
         except Exception as e:
-            total_time = time.time() - start_time
-            logger.error(f"Error analyzing job posting {job_id}: {e}")
-            
-            # Return minimal result rather than failing
-            return JobAnalysisResult(
-                job_id=job_id or "error_job",
-                skills=[],
-                entities=[],
-                keywords=[],
-                requirements_sections=[],
-                metadata={
-                    'error': str(e),
-                    'processing_time': total_time,
-                    'processing_timestamp': datetime.now().isoformat()
-                },
-                processing_time=total_time
-            )
+            logger.warning(f"Failed to cache result: {e}")
+        
+        # Update performance stats
+        self._update_performance_stats(total_time, skillner_time, parse_time + entity_time + keyword_time, fallback_time)
+        
+        return result
+
+    def _error_result(self, job_id: Optional[str], error: Exception, start_time: float) -> JobAnalysisResult:
+        """Minimal result returned instead of raising when a posting can't be analyzed"""
+        total_time = time.time() - start_time
+        logger.error(f"Error analyzing job posting {job_id}: {error}")
+        
+        return JobAnalysisResult(
+            job_id=job_id or "error_job",
+            skills=[],
+            entities=[],
+            keywords=[],
+            requirements_sections=[],
+            metadata={
+                'error': str(error),
+                'processing_time': total_time,
+                'processing_timestamp': datetime.now().isoformat()
+            },
+            processing_time=total_time
+        )
 
     def _deduplicate_skills_advanced(self, skills: List[ExtractedSkill]) -> List[ExtractedSkill]:
         """Advanced skill deduplication with similarity checking"""
@@ -686,27 +954,24 @@ class OptimizedJobAnalyzer:
         
         skill_groups = defaultdict(list)
         
-        # Group similar skills
+        # Group similar skills (names are already stripped by ExtractedSkill)
         for skill in skills:
-            key = skill.name.lower().strip()
             # Handle common variations
-            key = key.replace('.js', 'js').replace('_', ' ').replace('-', ' ')
+            key = skill.name.lower().replace('.js', 'js').replace('_', ' ').replace('-', ' ')
             skill_groups[key].append(skill)
         
         # Select best skill from each group
         deduplicated = []
         for group in skill_groups.values():
-            # Prefer skillNER over fallback, then by confidence
-            best_skill = max(group, key=lambda s: (
-                s.source == 'skillNER',  # Prefer skillNER
-                s.confidence,  # Then by confidence
-                -len(s.surface_form)  # Then by shorter surface form (more precise)
-            ))
+            if len(group) == 1:
+                deduplicated.append(group[0])
+                continue
+            # Prefer skillNER over fallback, then by confidence, then shorter surface form
+            best_skill = max(group, key=attrgetter('_sort_key'))
             deduplicated.append(best_skill)
         
-        # Sort by confidence and limit
-        result = sorted(deduplicated, key=lambda x: x.confidence, reverse=True)
-        return result[:self.max_skills_per_job]
+        # Top skills by confidence (same order as a stable descending sort, without sorting all)
+        return heapq.nlargest(self.max_skills_per_job, deduplicated, key=attrgetter('confidence'))
 
     def _update_performance_stats(self, total_time: float, skillner_time: float, 
                                  spacy_time: float, fallback_time: float):
@@ -729,14 +994,25 @@ class OptimizedJobAnalyzer:
         results = []
         failed_jobs = []
         
-        if self.enable_threading and len(job_postings) > 2:
-            # Parallel processing for large batches
+        if self.enable_threading and 2 < len(job_postings) < JOB_SPACY_PROCESS_MIN:
+            # Parallel processing for mid-sized batches. spaCy and skillNER hold the GIL, so
+            # multi-core hosts use a persistent process pool (models load once per worker, not
+            # per call); single-core hosts gain nothing from processes and stay on threads.
+            # Larger batches use the spaCy process pool below.
             logger.info(f"Processing {len(job_postings)} jobs in parallel with {self.max_workers} workers")
             
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            use_processes = (os.cpu_count() or 1) > 1 and (self.max_workers or 1) > 1
+            if use_processes:
+                executor = self._get_process_pool()
+                submit = lambda posting, job_id: executor.submit(_worker_analyze, posting, job_id)
+            else:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                submit = lambda posting, job_id: executor.submit(self.analyze_job_posting, posting, job_id)
+            
+            try:
                 # Submit all jobs
                 future_to_job = {
-                    executor.submit(self.analyze_job_posting, posting, job_id): (posting, job_id)
+                    submit(posting, job_id): (posting, job_id)
                     for posting, job_id in zip(job_postings, job_ids)
                 }
                 
@@ -746,29 +1022,80 @@ class OptimizedJobAnalyzer:
                     try:
                         result = future.result(timeout=30)  # 30 second timeout per job
                         results.append(result)
+                        if use_processes:
+                            self._record_worker_result(posting, result)
                         if (i + 1) % 10 == 0:  # Progress logging every 10 jobs
                             logger.info(f"Completed {i + 1}/{len(job_postings)} jobs")
+                    except BrokenProcessPool as e:
+                        logger.error(f"Failed to analyze job {job_id}: {e}")
+                        failed_jobs.append({'job_id': job_id, 'error': str(e)})
+                        self._discard_process_pool(executor)
                     except Exception as e:
                         logger.error(f"Failed to analyze job {job_id}: {e}")
                         failed_jobs.append({'job_id': job_id, 'error': str(e)})
+            finally:
+                if not use_processes:
+                    executor.shutdown(wait=True)
         else:
-            # Sequential processing
-            logger.info(f"Processing {len(job_postings)} jobs sequentially")
-            for i, (posting, job_id) in enumerate(zip(job_postings, job_ids)):
-                try:
-                    result = self.analyze_job_posting(posting, job_id)
-                    results.append(result)
-                    if (i + 1) % 5 == 0:  # Progress logging every 5 jobs
-                        logger.info(f"Completed {i + 1}/{len(job_postings)} jobs")
-                except Exception as e:
-                    logger.error(f"Failed to analyze job {job_id}: {e}")
-                    failed_jobs.append({'job_id': job_id, 'error': str(e)})
+            # One batched spaCy pass (multi-process for large threaded batches)
+            logger.info(f"Processing {len(job_postings)} jobs in one batch")
+            try:
+                results = self.analyze_batch(job_postings, job_ids)
+            except Exception as e:
+                logger.error(f"Failed to analyze job batch: {e}")
+                failed_jobs.extend({'job_id': job_id, 'error': str(e)} for job_id in job_ids)
         
         total_processing_time = time.time() - start_time
         logger.info(f"Batch processing completed in {total_processing_time:.2f}s")
         
         return self._aggregate_results_enhanced(results, failed_jobs, total_processing_time)
 
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """The analyzer's worker pool, (re)created only when worker settings change"""
+        config = (self.max_workers, self.spacy_model, self.confidence_threshold,
+                  self.max_skills_per_job, self.fast_mode, self.cache_size)
+        with self._process_pool_lock:
+            if self._process_pool is not None and self._process_pool_config != config:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_worker_init, initargs=config[1:]
+                )
+                self._process_pool_config = config
+            return self._process_pool
+
+    def _discard_process_pool(self, executor: ProcessPoolExecutor):
+        """Drop a broken pool (a worker died) so the next batch starts a fresh one"""
+        with self._process_pool_lock:
+            if self._process_pool is executor:
+                self._process_pool = None
+                self._process_pool_config = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """Shut down the worker pool, if one was started"""
+        with self._process_pool_lock:
+            executor, self._process_pool = self._process_pool, None
+            self._process_pool_config = None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _record_worker_result(self, posting: str, result: JobAnalysisResult):
+        """Fold a result computed in a worker process into this analyzer's cache and stats"""
+        if result.cache_hit or 'error' in result.metadata:
+            return
+        try:
+            self._cache_put(self._get_cache_key(self.clean_and_validate_text(posting)), result)
+        except Exception as e:
+            logger.warning(f"Failed to cache result: {e}")
+        times = result.metadata.get('processing_times', {})
+        self._update_performance_stats(
+            result.processing_time, times.get('skillner', 0.0),
+            times.get('parse', 0.0) + times.get('entities', 0.0) + times.get('keywords', 0.0),
+            times.get('fallback', 0.0)
+        )
+
     def _aggregate_results_enhanced(self, results: List[JobAnalysisResult], 
                                   failed_jobs: List[Dict], total_time: float) -> Dict[str, Any]:
         """Enhanced result aggregation with detailed analytics"""
@@ -779,28 +1106,38 @@ class OptimizedJobAnalyzer:
                 'processing_time': total_time
             }
         
-        # Collect comprehensive statistics
-        all_skills = []
-        all_entities = []
-        all_keywords = []
-        skill_types = defaultdict(list)
-        skill_sources = defaultdict(list)
+        # Collect comprehensive statistics as running counts (no per-mention lists)
+        all_skills = Counter()
+        all_entities = Counter()
+        all_keywords = Counter()
+        skill_types = defaultdict(Counter)
+        skill_sources = defaultdict(Counter)
+        total_skill_occurrences = 0
         processing_times = []
         cache_hits = 0
+        # Serialized per-result output, built in the same pass over skills/entities
+        individual_results = []
         
         for result in results:
             # Skills analysis
+            total_skill_occurrences += len(result.skills)
+            skill_dicts = []
             for skill in result.skills:
-                all_skills.append(skill.name)
-                skill_types[skill.skill_type].append(skill.name)
-                skill_sources[skill.source].append(skill.name)
+                all_skills[skill.name] += 1
+                skill_types[skill.skill_type][skill.name] += 1
+                skill_sources[skill.source][skill.name] += 1
+                skill_dicts.append(self._skill_to_dict(skill))
             
             # Entities and keywords
+            entity_dicts = []
             for entity in result.entities:
-                all_entities.append(entity.text.lower())
+                all_entities[entity.text.lower()] += 1
+                entity_dicts.append(self._entity_to_dict(entity))
+            
+            individual_results.append(self._result_to_dict_enhanced(result, skill_dicts, entity_dicts))
             
             for keyword in result.keywords:
-                all_keywords.extend([keyword['text']] * keyword['frequency'])
+                all_keywords[keyword['text']] += keyword['frequency']
             
             # Performance metrics
             processing_times.append(result.processing_time)
@@ -809,13 +1146,13 @@ class OptimizedJobAnalyzer:
         
         # Calculate advanced statistics
         total_jobs = len(results)
-        avg_skills_per_job = sum(len(r.skills) for r in results) / total_jobs if total_jobs > 0 else 0
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
+        avg_skills_per_job = total_skill_occurrences / total_jobs if total_jobs > 0 else 0
+        times = np.asarray(processing_times, dtype=float)
+        avg_processing_time = float(times.mean()) if times.size else 0
         cache_hit_rate = cache_hits / total_jobs if total_jobs > 0 else 0
         
         # Skill diversity metrics
-        unique_skills = set(all_skills)
-        skill_diversity = len(unique_skills) / len(all_skills) if all_skills else 0
+        skill_diversity = len(all_skills) / total_skill_occurrences if total_skill_occurrences else 0
         
         return {
             'summary': {
@@ -827,82 +1164,88 @@ class OptimizedJobAnalyzer:
                 'total_processing_time': round(total_time, 2),
                 'cache_hit_rate': round(cache_hit_rate, 3),
                 'skill_diversity': round(skill_diversity, 3),
-                'total_unique_skills': len(unique_skills),
-                'total_unique_entities': len(set(all_entities)),
+                'total_unique_skills': len(all_skills),
+                'total_unique_entities': len(all_entities),
                 'processing_timestamp': datetime.now().isoformat()
             },
             'skills_analysis': {
-                'top_skills': Counter(all_skills).most_common(25),
-                'skills_by_type': {k: Counter(v).most_common(15) for k, v in skill_types.items()},
-                'skills_by_source': {k: Counter(v).most_common(15) for k, v in skill_sources.items()},
+                'top_skills': all_skills.most_common(25),
+                'skills_by_type': {k: v.most_common(15) for k, v in skill_types.items()},
+                'skills_by_source': {k: v.most_common(15) for k, v in skill_sources.items()},
                 'skill_frequency_distribution': self._get_frequency_distribution(all_skills)
             },
             'entities_analysis': {
-                'top_entities': Counter(all_entities).most_common(20),
+                'top_entities': all_entities.most_common(20),
                 'entity_frequency_distribution': self._get_frequency_distribution(all_entities)
             },
             'keywords_analysis': {
-                'top_keywords': Counter(all_keywords).most_common(25),
+                'top_keywords': all_keywords.most_common(25),
                 'keyword_frequency_distribution': self._get_frequency_distribution(all_keywords)
             },
             'performance_metrics': {
                 'processing_times': {
-                    'min': min(processing_times) if processing_times else 0,
-                    'max': max(processing_times) if processing_times else 0,
+                    'min': float(times.min()) if times.size else 0,
+                    'max': float(times.max()) if times.size else 0,
                     'avg': avg_processing_time,
-                    'median': sorted(processing_times)[len(processing_times)//2] if processing_times else 0
+                    # Upper median via selection rather than a full sort
+                    'median': float(np.partition(times, times.size // 2)[times.size // 2]) if times.size else 0
                 },
                 'cache_performance': {
                     'hit_rate': cache_hit_rate,
                     'total_hits': cache_hits,
-                    'cache_stats': self._cache_stats.copy()
+                    'cache_stats': self._cache_stats_snapshot()
                 },
                 'overall_stats': self._performance_stats.copy()
             },
-            'individual_results': [self._result_to_dict_enhanced(r) for r in results],
+            'individual_results': individual_results,
             'failed_jobs': failed_jobs,
             'export_timestamp': datetime.now().isoformat()
         }
 
-    def _get_frequency_distribution(self, items: List[str]) -> Dict[str, int]:
-        """Calculate frequency distribution ranges"""
-        if not items:
+    def _get_frequency_distribution(self, counter: Counter) -> Dict[str, int]:
+        """Calculate frequency distribution ranges from item counts"""
+        if not counter:
             return {}
         
-        counter = Counter(items)
-        freq_counts = Counter(counter.values())
+        freqs = np.fromiter(counter.values(), dtype=np.int64, count=len(counter))
         
         return {
-            'single_occurrence': freq_counts.get(1, 0),
-            'low_frequency_2_5': sum(freq_counts.get(i, 0) for i in range(2, 6)),
-            'medium_frequency_6_10': sum(freq_counts.get(i, 0) for i in range(6, 11)),
-            'high_frequency_11_plus': sum(freq_counts.get(i, 0) for i in range(11, max(freq_counts.keys()) + 1)) if freq_counts else 0
+            'single_occurrence': int((freqs == 1).sum()),
+            'low_frequency_2_5': int(((freqs >= 2) & (freqs <= 5)).sum()),
+            'medium_frequency_6_10': int(((freqs >= 6) & (freqs <= 10)).sum()),
+            'high_frequency_11_plus': int((freqs >= 11).sum())
+        }
+
+    @staticmethod
+    def _skill_to_dict(s: ExtractedSkill) -> Dict[str, Any]:
+        return {
+            'name': s.name,
+            'surface_form': s.surface_form,
+            'confidence': round(s.confidence, 3),
+            'type': s.skill_type,
+            'source': s.source
+        }
+
+    @staticmethod
+    def _entity_to_dict(e: ExtractedEntity) -> Dict[str, Any]:
+        return {
+            'text': e.text,
+            'label': e.label,
+            'description': e.description,
+            'confidence': round(e.confidence, 3),
+            'position': {'start': e.start, 'end': e.end}
         }
 
-    def _result_to_dict_enhanced(self, result: JobAnalysisResult) -> Dict[str, Any]:
-        """Enhanced result serialization with more metadata"""
+    def _result_to_dict_enhanced(self, result: JobAnalysisResult,
+                                 skill_dicts: List[Dict[str, Any]] = None,
+                                 entity_dicts: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Enhanced result serialization with more metadata; pass already-serialized skills/entities to reuse them"""
         return {
             'job_id': result.job_id,
             'processing_time': result.processing_time,
             'cache_hit': result.cache_hit,
-            'skills': [
-                {
-                    'name': s.name,
-                    'surface_form': s.surface_form,
-                    'confidence': round(s.confidence, 3),
-                    'type': s.skill_type,
-                    'source': s.source
-                } for s in result.skills
-            ],
-            'entities': [
-                {
-                    'text': e.text,
-                    'label': e.label,
-                    'description': e.description,
-                    'confidence': round(e.confidence, 3),
-                    'position': {'start': e.start, 'end': e.end}
-                } for e in result.entities
-            ],
+            'skills': skill_dicts if skill_dicts is not None else [self._skill_to_dict(s) for s in result.skills],
+            'entities': entity_dicts if entity_dicts is not None else [self._entity_to_dict(e) for e in result.entities],
             'keywords': result.keywords,
             'metadata': result.metadata
         }
@@ -917,26 +1260,27 @@ class OptimizedJobAnalyzer:
         
         try:
             if format_type.lower() == 'json':
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(results, default=str,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             elif format_type.lower() == 'csv':
-                # Export summary data to CSV
-                summary_data = []
-                for result in results.get('individual_results', []):
-                    row = {
-                        'job_id': result['job_id'],
-                        'processing_time': result['processing_time'],
-                        'cache_hit': result['cache_hit'],
-                        'skills_count': len(result['skills']),
-                        'entities_count': len(result['entities']),
-                        'keywords_count': len(result['keywords']),
-                        'top_skills': ', '.join([s['name'] for s in result['skills'][:5]])
-                    }
-                    summary_data.append(row)
-                
-                df = pd.DataFrame(summary_data)
-                df.to_csv(filename, index=False, encoding='utf-8')
+                # Stream summary rows straight to the file
+                fieldnames = ['job_id', 'processing_time', 'cache_hit', 'skills_count',
+                              'entities_count', 'keywords_count', 'top_skills']
+                with open(filename, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    for result in results.get('individual_results', []):
+                        writer.writerow({
+                            'job_id': result['job_id'],
+                            'processing_time': result['processing_time'],
+                            'cache_hit': result['cache_hit'],
+                            'skills_count': len(result['skills']),
+                            'entities_count': len(result['entities']),
+                            'keywords_count': len(result['keywords']),
+                            'top_skills': ', '.join([s['name'] for s in result['skills'][:5]])
+                        })
             
             else:
                 raise ValueError(f"Unsupported format: {format_type}")
@@ -959,7 +1303,7 @@ class OptimizedJobAnalyzer:
         
         return {
             'performance_stats': stats,
-            'cache_stats': self._cache_stats.copy(),
+            'cache_stats': self._cache_stats_snapshot(),
             'configuration': {
                 'fast_mode': self.fast_mode,
                 'confidence_threshold': self.confidence_threshold,
@@ -975,18 +1319,52 @@ class OptimizedJobAnalyzer:
         """Clear the result cache"""
         with self._cache_lock:
             self._result_cache.clear()
-            self._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+            self._clean_cache.clear()
+            with self._cache_stats_lock:
+                for stats in self._cache_stats_by_thread.values():
+                    stats.update(hits=0, misses=0, evictions=0)
         logger.info("Cache cleared")
 
-    def optimize_for_batch_processing(self, expected_batch_size: int):
-        """Optimize settings for batch processing"""
+    def optimize_for_batch_processing(self, expected_batch_size: int, io_bound: bool = False):
+        """
+        Optimize settings for batch processing
+        
+        Worker counts follow the CPU count: analysis is CPU-bound and runs in worker processes,
+        so it is capped at one process per core minus one for the web process. io_bound=True
+        allows ThreadPoolExecutor's default bound instead (min(32, cores + 4)).
+        """
+        cores = os.cpu_count() or 1
+        worker_cap = min(32, cores + 4) if io_bound else max(1, cores - 1)
+        
         if expected_batch_size > 100:
             self.enable_threading = True
-            self.max_workers = min(8, expected_batch_size // 10)
+            self.max_workers = max(1, min(worker_cap, expected_batch_size // 10))
             self.cache_size = min(1024, expected_batch_size * 2)
         elif expected_batch_size > 20:
             self.enable_threading = True
-            self.max_workers = 4
+            self.max_workers = min(worker_cap, 4)
         
         logger.info(f"Optimized for batch size {expected_batch_size}: "
-                   f"threading={self.enable_threading}, workers={self.max_workers}")
\ No newline at end of file
+                   f"threading={self.enable_threading}, workers={self.max_workers} "
+                   f"(cores={cores}, io_bound={io_bound})")
+
+
+# Per-process analyzer used by analyze_multiple_postings' worker pool
+_WORKER_ANALYZER: Optional[OptimizedJobAnalyzer] = None
+
+
+def _worker_init(spacy_model: str, confidence_threshold: float, max_skills_per_job: int,
+                 fast_mode: bool, cache_size: int):
+    """Load spaCy and skillNER once per worker process"""
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = OptimizedJobAnalyzer(
+        spacy_model=spacy_model,
+        confidence_threshold=confidence_threshold,
+        max_skills_per_job=max_skills_per_job,
+        fast_mode=fast_mode,
+        cache_size=cache_size
+    )
+
+
+def _worker_analyze(posting: str, job_id: str) -> JobAnalysisResult:
+    return _WORKER_ANALYZER.analyze_job_posting(posting, job_id)
@@ -1,5 +1,83 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
 from jobspy import scrape_jobs
 
+logger = logging.getLogger(__name__)
+
+# Identical searches within the TTL reuse the previous scrape instead of hitting the job boards
+JOBSPY_CACHE_TTL_SECONDS = int(os.environ.get("JOBSPY_CACHE_TTL_SECONDS", "300"))
+JOBSPY_CACHE_MAX_ENTRIES = 256
+
+_scrape_cache = {}  # key -> (stored_at, DataFrame), oldest first
+_scrape_cache_lock = threading.Lock()
+
+
+def _scrape_cache_key(jobspy_params):
+    return repr(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in jobspy_params.items()
+    ))
+
+
+def _cached_scrape_jobs(jobspy_params):
+    """scrape_jobs() with a short-lived in-process cache keyed on the final parameters"""
+    key = _scrape_cache_key(jobspy_params)
+    now = time.monotonic()
+    with _scrape_cache_lock:
+        entry = _scrape_cache.get(key)
+        if entry is not None and now - entry[0] < JOBSPY_CACHE_TTL_SECONDS:
+            return entry[1].copy()
+    
+    jobs = scrape_jobs(**jobspy_params)
+    
+    # Empty results are often transient scraper failures, so don't pin them
+    if JOBSPY_CACHE_TTL_SECONDS > 0 and jobs is not None and not jobs.empty:
+        with _scrape_cache_lock:
+            _scrape_cache.pop(key, None)
+            while len(_scrape_cache) >= JOBSPY_CACHE_MAX_ENTRIES:
+                del _scrape_cache[next(iter(_scrape_cache))]
+            _scrape_cache[key] = (time.monotonic(), jobs.copy())
+    return jobs
+
+
+def _scrape_sites_concurrently(jobspy_params):
+    """One cached scrape per site on its own thread, combined like jobspy's multi-site output"""
+    site_names = jobspy_params['site_name']
+    
+    def scrape_site(site):
+        return _cached_scrape_jobs({**jobspy_params, 'site_name': [site]})
+    
+    frames, errors = [], []
+    with ThreadPoolExecutor(max_workers=len(site_names)) as executor:
+        futures = {site: executor.submit(scrape_site, site) for site in site_names}
+        for site, future in futures.items():
+            try:
+                jobs = future.result()
+            except Exception as e:
+                # One failing board shouldn't discard the others' results
+                logger.warning("jobspy scrape failed for %s: %s", site, e)
+                errors.append(e)
+                continue
+            if jobs is not None and not jobs.empty:
+                frames.append(jobs)
+    
+    if not frames:
+        if errors and len(errors) == len(site_names):
+            raise errors[0]
+        return pd.DataFrame()
+    
+    combined = pd.concat(frames, ignore_index=True)
+    if 'site' in combined.columns:
+        # jobspy groups multi-site results by site; each frame is already in its own order
+        combined = combined.sort_values(by='site', kind='stable', ignore_index=True)
+    return combined
+
+
 def fetch_jobs_from_jobspy(site_names, search_term, location, results_wanted, job_type=None, work_type=None, hours_old=None, distance=None, **kwargs):
     """
     Fetch jobs using jobspy for the given platforms and parameters.
@@ -58,5 +136,6 @@ def fetch_jobs_from_jobspy(site_names, search_term, location, results_wanted, jo
         if key not in jobspy_params and value is not None:
             jobspy_params[key] = value
     
-    
-    return scrape_jobs(**jobspy_params)
+    if isinstance(site_names, (list, tuple)) and len(site_names) > 1:
+        return _scrape_sites_concurrently(jobspy_params)
+    return _cached_scrape_jobs(jobspy_params)
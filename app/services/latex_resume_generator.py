@@ -9,6 +9,7 @@ import subprocess
 import tempfile
 import logging
 import json
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -43,6 +44,25 @@ from .latex_templates import (
 logger = logging.getLogger(__name__)
 
 
+# Environment for every pdflatex run, built once rather than copied per compile
+_PDFLATEX_ENV = {
+    **os.environ,
+    'MIKTEX_AUTOINSTALL': 'no',  # Disable auto-install to avoid permission issues
+    'MIKTEX_ENABLE_INSTALLER': 'no',
+    'max_print_line': '10000',  # Prevent line wrapping in error messages
+}
+
+
+@lru_cache(maxsize=1)
+def _pdflatex_available() -> bool:
+    """Probe for pdflatex once per process instead of spawning it before every compile"""
+    try:
+        subprocess.run(['pdflatex', '--version'], capture_output=True, check=True, timeout=5)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+
 class LaTeXResumeGenerator:
     """Service for generating professional resumes in PDF format using LaTeX"""
     
@@ -795,29 +815,19 @@ class LaTeXResumeGenerator:
         """Compile LaTeX file to PDF with fallback to ReportLab"""
         try:
             # Check if pdflatex is available
-            try:
-                subprocess.run(['pdflatex', '--version'], capture_output=True, check=True, timeout=5)
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            if not _pdflatex_available():
                 logger.warning("pdflatex is not installed or not available in PATH. Using ReportLab fallback.")
                 return self._generate_pdf_with_reportlab(tex_file.parent, output_path, profile_data)
             
-            # Change to temp directory for compilation
-            original_cwd = os.getcwd()
-            os.chdir(tex_file.parent)
-            
-            # Set environment variables to handle MiKTeX issues
-            env = os.environ.copy()
-            env['MIKTEX_AUTOINSTALL'] = 'no'  # Disable auto-install to avoid permission issues
-            env['MIKTEX_ENABLE_INSTALLER'] = 'no'
-            env['max_print_line'] = '10000'  # Prevent line wrapping in error messages
-            
             # Run pdflatex command with increased timeout and better error handling
             cmd = ['pdflatex', '-interaction=nonstopmode', '-halt-on-error', '-file-line-error', tex_file.name]
             
             # Run twice to resolve references
             for i in range(2):
                 try:
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=env)
+                    # Compile inside the temp directory without chdir, which would race across threads
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=_PDFLATEX_ENV,
+                                            cwd=str(tex_file.parent))
                     
                     # Check for specific MiKTeX errors
                     if result.returncode != 0:
@@ -832,7 +842,6 @@ class LaTeXResumeGenerator:
                         # Handle MiKTeX administrator update issue
                         if "administrator has checked for updates" in error_msg:
                             logger.warning("MiKTeX administrator update issue detected. Using ReportLab fallback.")
-                            os.chdir(original_cwd)
                             return self._generate_pdf_with_reportlab(tex_file.parent, output_path, profile_data)
                         
                         # Handle package installation issues
@@ -847,7 +856,6 @@ class LaTeXResumeGenerator:
                                 continue
                             else:
                                 logger.warning("LaTeX compilation failed even with simplified template. Using ReportLab fallback.")
-                                os.chdir(original_cwd)
                                 return self._generate_pdf_with_reportlab(tex_file.parent, output_path, profile_data)
                         
                         # If first run failed, try simplified version
@@ -857,7 +865,6 @@ class LaTeXResumeGenerator:
                             continue
                         else:
                             logger.warning("LaTeX compilation failed after retry. Using ReportLab fallback.")
-                            os.chdir(original_cwd)
                             return self._generate_pdf_with_reportlab(tex_file.parent, output_path, profile_data)
                     else:
                         logger.info(f"LaTeX compilation successful on run {i+1}")
@@ -869,12 +876,8 @@ class LaTeXResumeGenerator:
                         continue
                     else:
                         logger.warning("LaTeX compilation timed out. Using ReportLab fallback.")
-                        os.chdir(original_cwd)
                         return self._generate_pdf_with_reportlab(tex_file.parent, output_path, profile_data)
             
-            # Move back to original directory
-            os.chdir(original_cwd)
-            
             # Get the generated PDF path
             pdf_file = tex_file.with_suffix('.pdf')
             
@@ -922,12 +925,10 @@ class LaTeXResumeGenerator:
                 
         except subprocess.TimeoutExpired:
             logger.warning("LaTeX compilation timed out. Using ReportLab fallback.")
-            os.chdir(original_cwd)
             return self._generate_pdf_with_reportlab(tex_file.parent, output_path, profile_data)
         except Exception as e:
             logger.error(f"PDF compilation error: {e}")
             logger.warning("LaTeX compilation failed. Using ReportLab fallback.")
-            os.chdir(original_cwd)
             return self._generate_pdf_with_reportlab(tex_file.parent, output_path, profile_data)
 
     def _generate_pdf_with_reportlab(self, temp_dir: Path, output_path: Optional[str] = None, profile_data: Optional[Dict[str, Any]] = None) -> str:
@@ -1539,3 +1540,9 @@ class LaTeXResumeGenerator:
 \\begin{document}
 
 """
+
+
+@lru_cache(maxsize=1)
+def get_latex_generator() -> LaTeXResumeGenerator:
+    """Process-wide generator shared by the batch and single-resume routes"""
+    return LaTeXResumeGenerator()
@@ -1,5 +1,47 @@
 import json
 import re
+from typing import Any, Optional
+
+import msgspec
+
+
+class ParsedResume(msgspec.Struct):
+    """Typed shape of the dict produced by ``normalize``; used to decode cached parse results."""
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    title: Optional[str] = None
+    headline: Optional[str] = None
+    location: Optional[str] = None
+    summary: Optional[str] = None
+    skills: list[str] = []
+    work_experience: list[dict[str, Any]] = []
+    education: list[dict[str, Any]] = []
+    projects: list[dict[str, Any]] = []
+    certifications: list[str] = []
+    languages: list[str] = []
+    links: list[str] = []
+    extracted_keywords: list[str] = []
+    # Set (alone) when the parser output could not be structured
+    raw: Optional[str] = None
+
+
+def to_parsed_resume(data):
+    """
+    Convert a normalized parse dict, including caches written by older versions, into a ParsedResume.
+
+    Older caches may store extracted_keywords as a comma-separated string or leave fields null;
+    those are coerced first. Raises msgspec.ValidationError if the data still doesn't fit.
+    """
+    if isinstance(data, dict):
+        data = {key: value for key, value in data.items() if value is not None}
+        keywords = data.get('extracted_keywords')
+        if isinstance(keywords, str):
+            data['extracted_keywords'] = [k.strip() for k in keywords.split(',') if k.strip()]
+        elif keywords is not None and not isinstance(keywords, list):
+            del data['extracted_keywords']
+    return msgspec.convert(data, ParsedResume, strict=False)
+
 
 def normalize(parsed_raw):
         """Normalize various parser outputs into a stable dict shape for the UI."""
@@ -7,6 +7,7 @@ actionable recommendations to improve user resumes/profiles for better job match
 
 import os
 import json
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
@@ -21,6 +22,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _is_connection_error(exc: BaseException) -> bool:
+    """True if exc (or anything it wraps) is a network-level failure rather than a bad response"""
+    while exc is not None:
+        if isinstance(exc, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+            return True
+        # SDK transport errors (e.g. groq.APIConnectionError / APITimeoutError) don't
+        # subclass the builtins, so match on the conventional names as well
+        if type(exc).__name__.endswith(('ConnectionError', 'ConnectError', 'TimeoutError', 'Timeout')):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
 @dataclass
 class ImprovementSuggestion:
     """Represents a specific improvement suggestion for a profile section"""
@@ -44,6 +58,7 @@ class ResumeAnalysis:
     experience_level_match: str
     summary: str
     action_items: List[str]
+    is_fallback: bool = False  # True when built by _fallback_analysis rather than the AI provider
 
 
 class ResumeImprover:
@@ -54,6 +69,11 @@ class ResumeImprover:
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         self.model = model
         self.provider = None
+        # Consecutive async provider calls that failed at the network level. Once
+        # max_connection_failures is reached, async calls fail immediately instead of
+        # waiting out another timeout (None disables the cut-off).
+        self.consecutive_connection_failures = 0
+        self.max_connection_failures: Optional[int] = None
         
         if GroqProvider and self.api_key:
             try:
@@ -168,6 +188,237 @@ class ResumeImprover:
             logger.error(f"Failed to analyze resume: {e}")
             return self._fallback_analysis(profile_data, job_description)
 
+    def analyze_and_improve_batch(self, profile_data: Dict[str, Any], job_descriptions: List[str]) -> List[ResumeAnalysis]:
+        """
+        Analyze one profile against several job descriptions in a single AI round trip
+        
+        Args:
+            profile_data: Dictionary containing profile information (from Profile model)
+            job_descriptions: Target job description texts
+            
+        Returns:
+            One ResumeAnalysis per job description, in the same order. Jobs the batched
+            response doesn't cover are analyzed individually via analyze_and_improve.
+        """
+        if not job_descriptions:
+            return []
+        if len(job_descriptions) == 1 or not self.provider or not hasattr(self.provider, '_generate_sync'):
+            return [self.analyze_and_improve(profile_data, jd) for jd in job_descriptions]
+        
+        analyses: List[Optional[ResumeAnalysis]] = [None] * len(job_descriptions)
+        try:
+            prompt = self._build_batch_analysis_prompt(profile_data, job_descriptions)
+            ai_response = self.provider._generate_sync(prompt, self._batch_options(len(job_descriptions)))
+            analyses = self._collect_batch_analyses(ai_response, len(job_descriptions))
+        except Exception as e:
+            logger.warning(f"Batched analysis failed, analyzing jobs individually: {e}")
+        
+        for i in self._missing_batch_items(analyses):
+            analyses[i] = self.analyze_and_improve(profile_data, job_descriptions[i])
+        return analyses
+
+    async def analyze_and_improve_async(self, profile_data: Dict[str, Any], job_description: str) -> ResumeAnalysis:
+        """
+        Async counterpart of analyze_and_improve that awaits the provider's async client
+        
+        Providers without an async generation method are run on a worker thread instead.
+        """
+        if not self.provider or not hasattr(self.provider, '_generate_async'):
+            return await asyncio.to_thread(self.analyze_and_improve, profile_data, job_description)
+        
+        analysis_prompt = self._build_analysis_prompt(profile_data, job_description)
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                ai_response = await self._generate_async_tracked(analysis_prompt, {
+                    "temperature": 0.1,
+                    "max_tokens": 4000,
+                    "stop": ["\n\n##"]
+                })
+                if not ai_response or len(ai_response.strip()) < 10:
+                    logger.warning(f"Empty AI response on attempt {attempt + 1}, retrying...")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(2)
+                    continue
+                
+                analysis = self._parse_ai_response(ai_response, profile_data, job_description)
+                if analysis:
+                    return analysis
+                logger.warning("Failed to parse AI response, using fallback")
+                break
+            except Exception as e:
+                if self.provider_unavailable:
+                    logger.error(f"AI provider unavailable, skipping remaining attempts: {e}")
+                    break
+                if attempt < max_retries - 1:
+                    logger.warning(f"AI call failed on attempt {attempt + 1}: {e}, retrying...")
+                    await asyncio.sleep(1)
+                else:
+                    logger.error(f"AI call failed after {max_retries} attempts: {e}")
+        
+        return self._fallback_analysis(profile_data, job_description)
+
+    async def analyze_and_improve_batch_async(self, profile_data: Dict[str, Any], job_descriptions: List[str]) -> List[ResumeAnalysis]:
+        """Async counterpart of analyze_and_improve_batch"""
+        if not job_descriptions:
+            return []
+        if len(job_descriptions) == 1 or not self.provider or not hasattr(self.provider, '_generate_async'):
+            return list(await asyncio.gather(
+                *(self.analyze_and_improve_async(profile_data, jd) for jd in job_descriptions)
+            ))
+        
+        analyses: List[Optional[ResumeAnalysis]] = [None] * len(job_descriptions)
+        try:
+            prompt = self._build_batch_analysis_prompt(profile_data, job_descriptions)
+            ai_response = await self._generate_async_tracked(prompt, self._batch_options(len(job_descriptions)))
+            analyses = self._collect_batch_analyses(ai_response, len(job_descriptions))
+        except Exception as e:
+            logger.warning(f"Batched analysis failed, analyzing jobs individually: {e}")
+        
+        missing = self._missing_batch_items(analyses)
+        retried = await asyncio.gather(
+            *(self.analyze_and_improve_async(profile_data, job_descriptions[i]) for i in missing)
+        )
+        for i, analysis in zip(missing, retried):
+            analyses[i] = analysis
+        return analyses
+
+    async def _generate_async_tracked(self, prompt: str, options: Dict[str, Any]) -> str:
+        if self.provider_unavailable:
+            raise ConnectionError(
+                f"AI provider unavailable after {self.consecutive_connection_failures} consecutive connection failures"
+            )
+        try:
+            ai_response = await self.provider._generate_async(prompt, options)
+        except Exception as e:
+            if _is_connection_error(e):
+                self.consecutive_connection_failures += 1
+            raise
+        self.consecutive_connection_failures = 0
+        return ai_response
+
+    @property
+    def provider_unavailable(self) -> bool:
+        return (self.max_connection_failures is not None and
+                self.consecutive_connection_failures >= self.max_connection_failures)
+
+    async def aclose(self) -> None:
+        """Release the provider's async HTTP client for the running event loop"""
+        if self.provider and hasattr(self.provider, 'aclose'):
+            await self.provider.aclose()
+
+    def _batch_options(self, job_count: int) -> Dict[str, Any]:
+        return {
+            "temperature": 0.1,
+            "max_tokens": min(32000, 4000 * job_count)
+        }
+
+    def _collect_batch_analyses(self, ai_response: Optional[str], job_count: int) -> List[Optional[ResumeAnalysis]]:
+        """Turn a batched response into per-job analyses, leaving None where an item is unusable"""
+        analyses: List[Optional[ResumeAnalysis]] = [None] * job_count
+        for index, item in self._parse_batch_ai_response(ai_response or '', job_count):
+            # Isolate each item so one malformed analysis doesn't discard the rest
+            try:
+                analyses[index] = self._analysis_from_dict(item)
+            except Exception as e:
+                logger.warning(f"Skipping invalid batched analysis for job {index + 1}: {e}")
+        return analyses
+
+    def _missing_batch_items(self, analyses: List[Optional[ResumeAnalysis]]) -> List[int]:
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+        if missing:
+            logger.info(f"Batched analysis covered {len(analyses) - len(missing)}/{len(analyses)} jobs")
+        return missing
+
+    def _build_batch_analysis_prompt(self, profile_data: Dict[str, Any], job_descriptions: List[str]) -> str:
+        """Build one prompt that asks for an analysis per numbered job description"""
+        profile_summary = self._extract_profile_summary(profile_data)
+        job_blocks = "\n\n".join(
+            f"## JOB {i}:\n```\n{jd}\n```" for i, jd in enumerate(job_descriptions, start=1)
+        )
+        
+        return f"""
+# RESUME IMPROVEMENT ANALYSIS ({len(job_descriptions)} JOBS)
+
+You are an expert career coach and ATS optimization specialist. Analyze the provided resume/profile separately against each of the {len(job_descriptions)} target job descriptions below and provide specific, actionable improvement recommendations for each job.
+
+## CURRENT RESUME/PROFILE:
+```
+{profile_summary}
+```
+
+{job_blocks}
+
+## OUTPUT FORMAT:
+
+Return a JSON array with exactly {len(job_descriptions)} objects, one per job, in job order:
+
+```json
+[
+  {{
+    "job_index": 1,
+    "overall_match_score": 0.75,
+    "missing_skills": ["skill1", "skill2"],
+    "keyword_gaps": ["keyword1", "keyword2"],
+    "industry_alignment": "strong|moderate|weak",
+    "experience_level_match": "perfect|close|gap",
+    "summary": "Brief overall assessment of profile strength and main gaps for this job",
+    "suggestions": [
+      {{
+        "section": "summary|skills|work_experience|education|projects|certifications",
+        "priority": "high|medium|low",
+        "type": "add|modify|rewrite|remove",
+        "current_content": "existing content or null",
+        "suggested_content": "specific improvement recommendation",
+        "reasoning": "why this change will improve job matching",
+        "impact_score": 0.8
+      }}
+    ],
+    "action_items": ["Specific action item 1", "Specific action item 2"]
+  }}
+]
+```
+
+## ANALYSIS GUIDELINES:
+- Identify critical keywords, tools and skills from each job description that are missing from the resume
+- Assess how well the current experience matches each job and how to reframe it in the job's language
+- Suggest achievement-focused, keyword-rich wording with quantifiable results where possible
+- Prioritize suggestions by impact on ATS and recruiter matching, and explain the reasoning
+- Treat every job independently; do not merge recommendations across jobs
+
+Return only the valid JSON array with no additional formatting or text.
+"""
+
+    def _parse_batch_ai_response(self, ai_response: str, expected: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """Decode a batched analysis response into (job position, analysis dict) pairs"""
+        cleaned_response = ai_response.strip()
+        json_start = cleaned_response.find('[')
+        json_end = cleaned_response.rfind(']') + 1
+        if json_start == -1 or json_end == 0:
+            logger.warning("No JSON array found in batched AI response")
+            return []
+        
+        try:
+            response_data = json.loads(cleaned_response[json_start:json_end])
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Failed to parse batched AI response: {e}")
+            return []
+        if not isinstance(response_data, list):
+            return []
+        
+        pairs = []
+        for position, item in enumerate(response_data):
+            if not isinstance(item, dict):
+                continue
+            # Prefer the model's own numbering; fall back to array position
+            try:
+                index = int(item.get('job_index', position + 1)) - 1
+            except (TypeError, ValueError):
+                index = position
+            if 0 <= index < expected:
+                pairs.append((index, item))
+        return pairs
+
     def _build_analysis_prompt(self, profile_data: Dict[str, Any], job_description: str) -> str:
         """Build a comprehensive prompt for AI analysis"""
         
@@ -361,47 +612,51 @@ Return only valid JSON with no additional formatting or text.
                 logger.warning("AI response is not a valid dictionary")
                 return None
             
-            # Parse suggestions
-            suggestions = []
-            for sugg_data in response_data.get('suggestions', []):
-                try:
-                    suggestion = ImprovementSuggestion(
-                        section=sugg_data.get('section', 'general'),
-                        priority=sugg_data.get('priority', 'medium'),
-                        type=sugg_data.get('type', 'modify'),
-                        current_content=sugg_data.get('current_content'),
-                        suggested_content=sugg_data.get('suggested_content', ''),
-                        reasoning=sugg_data.get('reasoning', ''),
-                        impact_score=float(sugg_data.get('impact_score', 0.5))
-                    )
-                    suggestions.append(suggestion)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Skipping invalid suggestion: {e}")
-                    continue
+            return self._analysis_from_dict(response_data)
             
-            # Create analysis object with validation
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.error(f"Failed to parse AI response: {e}")
+            logger.debug(f"Raw AI response (first 500 chars): {ai_response[:500]}")
+            return None
+
+    def _analysis_from_dict(self, response_data: Dict[str, Any]) -> Optional[ResumeAnalysis]:
+        """Build a ResumeAnalysis from one decoded analysis object"""
+        # Parse suggestions
+        suggestions = []
+        for sugg_data in response_data.get('suggestions', []):
             try:
-                analysis = ResumeAnalysis(
-                    overall_match_score=max(0.0, min(1.0, float(response_data.get('overall_match_score', 0.5)))),
-                    missing_skills=response_data.get('missing_skills', []) if isinstance(response_data.get('missing_skills'), list) else [],
-                    keyword_gaps=response_data.get('keyword_gaps', []) if isinstance(response_data.get('keyword_gaps'), list) else [],
-                    suggestions=suggestions,
-                    industry_alignment=response_data.get('industry_alignment', 'moderate'),
-                    experience_level_match=response_data.get('experience_level_match', 'close'),
-                    summary=response_data.get('summary', 'Analysis completed'),
-                    action_items=response_data.get('action_items', []) if isinstance(response_data.get('action_items'), list) else []
+                suggestion = ImprovementSuggestion(
+                    section=sugg_data.get('section', 'general'),
+                    priority=sugg_data.get('priority', 'medium'),
+                    type=sugg_data.get('type', 'modify'),
+                    current_content=sugg_data.get('current_content'),
+                    suggested_content=sugg_data.get('suggested_content', ''),
+                    reasoning=sugg_data.get('reasoning', ''),
+                    impact_score=float(sugg_data.get('impact_score', 0.5))
                 )
-                
-                logger.info(f"Successfully parsed AI response with {len(suggestions)} suggestions")
-                return analysis
-                
+                suggestions.append(suggestion)
             except (ValueError, TypeError) as e:
-                logger.error(f"Failed to create ResumeAnalysis object: {e}")
-                return None
+                logger.warning(f"Skipping invalid suggestion: {e}")
+                continue
+        
+        # Create analysis object with validation
+        try:
+            analysis = ResumeAnalysis(
+                overall_match_score=max(0.0, min(1.0, float(response_data.get('overall_match_score', 0.5)))),
+                missing_skills=response_data.get('missing_skills', []) if isinstance(response_data.get('missing_skills'), list) else [],
+                keyword_gaps=response_data.get('keyword_gaps', []) if isinstance(response_data.get('keyword_gaps'), list) else [],
+                suggestions=suggestions,
+                industry_alignment=response_data.get('industry_alignment', 'moderate'),
+                experience_level_match=response_data.get('experience_level_match', 'close'),
+                summary=response_data.get('summary', 'Analysis completed'),
+                action_items=response_data.get('action_items', []) if isinstance(response_data.get('action_items'), list) else []
+            )
             
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.error(f"Failed to parse AI response: {e}")
-            logger.debug(f"Raw AI response (first 500 chars): {ai_response[:500]}")
+            logger.info(f"Successfully parsed AI response with {len(suggestions)} suggestions")
+            return analysis
+            
+        except (ValueError, TypeError) as e:
+            logger.error(f"Failed to create ResumeAnalysis object: {e}")
             return None
 
     def _fallback_analysis(self, profile_data: Dict[str, Any], job_description: str) -> ResumeAnalysis:
@@ -462,7 +717,8 @@ Return only valid JSON with no additional formatting or text.
                 'Add relevant skills from job description',
                 'Quantify achievements in work experience',
                 'Ensure keywords appear throughout resume'
-            ]
+            ],
+            is_fallback=True
         )
 
     def generate_improved_profile(self, profile_data: Dict[str, Any], analysis: ResumeAnalysis) -> Dict[str, Any]:
@@ -479,8 +735,8 @@ Return only valid JSON with no additional formatting or text.
         improved_profile = profile_data.copy()
         changes_applied = []
         
-        logger.info(f"generate_improved_profile called with profile_data type: {type(profile_data)}")
-        logger.info(f"profile_data content (first 200 chars): {str(profile_data)[:200]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("generate_improved_profile input head: %s", str(profile_data)[:200])
         
         # Apply suggestions based on priority and impact
         for suggestion in analysis.suggestions:
@@ -520,8 +776,8 @@ Return only valid JSON with no additional formatting or text.
         improved_profile['_changes_applied'] = changes_applied
         improved_profile['_improvement_score'] = analysis.overall_match_score
         
-        logger.info(f"generate_improved_profile returning type: {type(improved_profile)}")
-        logger.info(f"improved_profile content (first 200 chars): {str(improved_profile)[:200]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("improved_profile head: %s", str(improved_profile)[:200])
         
         return improved_profile
 
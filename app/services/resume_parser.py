@@ -64,6 +64,15 @@ def parse_resume(path: str) -> dict:
     work_experience (list), education (list), projects (list), certifications (list), languages (list), links (list)
     """
     text, file_links = _read_text_from_file(path)
+    return parse_resume_text_fallback(text, file_links)
+
+
+def parse_resume_text_fallback(text: str, file_links=None) -> dict:
+    """Parse already-extracted resume text with the local heuristics.
+
+    Same output as parse_resume; file_links are URLs found in the source file's metadata.
+    """
+    text = text or ''
     # Normalize and de-duplicate blank lines
     lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     full_text = '\n'.join(lines)
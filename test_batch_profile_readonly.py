@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test that batch resume improvement never mutates the profile dict shared across jobs.
+"""
+
+import copy
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the flask-website directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services import batch_resume_improver
+from app.services.batch_resume_improver import BatchResumeImprover
+from app.services.resume_improver import ResumeImprover
+
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer with Python, Docker, Kubernetes and AWS experience. "
+    "Strong SQL, agile teamwork and communication skills are required."
+)
+
+
+def _make_profile():
+    return {
+        'name': 'Jane Doe',
+        'headline': 'Software Engineer',
+        'skills': ['Python', 'SQL'],
+        'work_experience': [
+            {'title': 'Engineer', 'company': 'Acme', 'highlights': ['Built APIs', 'Led migrations']}
+        ],
+        'education': [{'school': 'State University', 'degree': 'BSc'}],
+        'links': {'github': 'https://github.com/janedoe'}
+    }
+
+
+def _make_processor():
+    # No provider (fallback analysis), no LLM cache and no pdflatex
+    os.environ.pop('GROQ_API_KEY', None)
+    batch_resume_improver._llm_cache = False
+    processor = BatchResumeImprover(resume_improver=ResumeImprover(), latex_generator=object())
+
+    def fake_pdf(improved_profile, job, batch_dir, job_id):
+        pdf_path = batch_dir / f"{job_id}.pdf"
+        pdf_path.write_bytes(b'%PDF-1.4\n' + b'0' * 2048)
+        return str(pdf_path)
+
+    processor._generate_job_specific_resume = fake_pdf
+    return processor
+
+
+def test_process_single_job_leaves_profile_unchanged():
+    """Several jobs processed against one profile dict leave it exactly as it was."""
+    processor = _make_processor()
+    profile = _make_profile()
+    original = copy.deepcopy(profile)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for index in range(3):
+            job = {
+                'title': f'Backend Engineer {index}',
+                'company': 'Example',
+                'job_url': 'https://example.com/jobs/view',
+                'description': JOB_DESCRIPTION
+            }
+            result = processor._process_single_job(profile, job, 'view', index, Path(tmp))
+            assert result['status'] == 'success', result.get('error')
+
+    assert profile == original
+
+    print("✓ Shared profile unchanged after batch jobs")
+
+
+def test_generate_improved_profile_returns_copy():
+    """The improved profile is a separate dict; the input keeps its skills and summary."""
+    improver = ResumeImprover()
+    profile = _make_profile()
+    original = copy.deepcopy(profile)
+
+    analysis = improver._fallback_analysis(profile, JOB_DESCRIPTION)
+    improved = improver.generate_improved_profile(profile, analysis)
+
+    assert improved is not profile
+    assert improved.get('summary')
+    assert profile == original
+
+    print("✓ generate_improved_profile leaves its input unchanged")
+
+
+if __name__ == "__main__":
+    test_process_single_job_leaves_profile_unchanged()
+    test_generate_improved_profile_returns_copy()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test that EmailService.validate_email only rejects known domain typos and never
+rejects real domains that merely look like a popular provider.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the flask-website directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.EmailService import EmailService
+
+
+def test_valid_near_miss_domains():
+    """Real domains close to a known provider must still be accepted."""
+    service = EmailService(api_key='test')
+
+    for email in [
+        "user@protonmail.ch",
+        "user@bol.com",
+        "user@fmail.com",
+        "user@hmail.com",
+        "user@zmail.com",
+        "user@mail.co",
+        "user@mail.com",
+        "user@email.com",
+        "user@gmail.com",
+    ]:
+        is_valid, message = service.validate_email(email)
+        assert is_valid, f"{email} was rejected: {message}"
+
+    print("✓ Near-miss domains accepted")
+
+
+def test_known_typos_rejected():
+    """Exact entries of the typo table are rejected with a suggestion."""
+    service = EmailService(api_key='test')
+
+    is_valid, message = service.validate_email("user@gmial.com")
+    assert not is_valid
+    assert message == "Did you mean user@gmail.com?"
+
+    is_valid, message = service.validate_email("user@YAHOOO.com")
+    assert not is_valid
+    assert message == "Did you mean user@yahoo.com?"
+
+    print("✓ Known typos rejected")
+
+
+def test_fuzzy_suggestion_is_advisory():
+    """A fuzzy near-miss produces a hint but the address stays valid."""
+    service = EmailService(api_key='test')
+
+    is_valid, message = service.validate_email("user@gmaill.com")
+    assert is_valid
+    assert "did you mean user@gmail.com?" in message
+
+    print("✓ Fuzzy suggestion is advisory")
+
+
+if __name__ == "__main__":
+    test_valid_near_miss_domains()
+    test_known_typos_rejected()
+    test_fuzzy_suggestion_is_advisory()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test that parse caches written by older versions of the parse endpoint still decode
+into a ParsedResume, and that unusable caches are discarded instead of raising.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the flask-website directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.routes import _decode_parse_cache
+
+
+def _write_cache(directory, name, payload):
+    cache_path = Path(directory) / name
+    with cache_path.open('w', encoding='utf-8') as cj:
+        json.dump(payload, cj)
+    return cache_path
+
+
+def test_legacy_cache_decodes():
+    """A legacy cache with string keywords, nulls and extra keys is still usable."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = _write_cache(tmp, 'legacy.parsed.json', {
+            'name': 'Jane Doe',
+            'email': 'jane@example.com',
+            'phone': None,
+            'skills': ['Python', 'SQL'],
+            'certifications': None,
+            'work_experience': [{'title': 'Engineer', 'company': 'Acme'}],
+            'extracted_keywords': 'python, sql , ,docker',
+            'parser_version': 1
+        })
+
+        parsed = _decode_parse_cache(cache_path)
+
+    assert parsed is not None
+    assert parsed.name == 'Jane Doe'
+    assert parsed.phone is None
+    assert parsed.skills == ['Python', 'SQL']
+    assert parsed.certifications == []
+    assert parsed.work_experience == [{'title': 'Engineer', 'company': 'Acme'}]
+    assert parsed.extracted_keywords == ['python', 'sql', 'docker']
+
+    print("✓ Legacy parse cache decoded")
+
+
+def test_unusable_cache_discarded():
+    """Malformed or wrongly shaped caches return None."""
+    with tempfile.TemporaryDirectory() as tmp:
+        broken = Path(tmp) / 'broken.parsed.json'
+        broken.write_text('{"name": ', encoding='utf-8')
+        wrong_shape = _write_cache(tmp, 'wrong.parsed.json', {'skills': 'Python'})
+
+        assert _decode_parse_cache(broken) is None
+        assert _decode_parse_cache(wrong_shape) is None
+
+    print("✓ Unusable parse caches discarded")
+
+
+if __name__ == "__main__":
+    test_legacy_cache_decodes()
+    test_unusable_cache_discarded()